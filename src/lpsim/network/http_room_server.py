@@ -6,7 +6,7 @@ import time
 import logging
 import random
 import threading
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from typing import List, Tuple
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -100,6 +100,8 @@ class HTTPRoomServer:
     link of the server.
     It only starts rooms with same rules now. When running on Linux, it will
     collect deck codes of stopped rooms, but not on Windows.
+    Every room runs in its own `OneRoomWorker` process, so matches in different
+    rooms are stepped in parallel, and each match keeps affinity to its worker.
 
     Args:
         max_rooms (int): Max number of rooms that can be created. All rooms
@@ -152,7 +154,7 @@ class HTTPRoomServer:
                 "deck information."
             )
 
-        self.app = FastAPI()
+        self.app = FastAPI(default_response_class=ORJSONResponse)
         app = self.app
 
         app.add_middleware(
@@ -160,8 +162,8 @@ class HTTPRoomServer:
             allow_origins=allow_origins,
             # allow_origins=['*'],
             allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
+            allow_methods=["GET", "POST", "DELETE"],
+            allow_headers=["Content-Type", "Accept"],
         )
         app.add_middleware(GZipMiddleware)
 
@@ -195,16 +197,16 @@ class HTTPRoomServer:
                 room_name (str): The name of the room.
 
             Returns:
-                JSONResponse: The response containing the port (if success) and status
-                of the room. When status is exist or created, the corresponding port
-                will be returned. Otherwise, only status will be returned.
+                ORJSONResponse: The response containing the port (if success) and
+                status of the room. When status is exist or created, the corresponding
+                port will be returned. Otherwise, only status will be returned.
             """
             if room_name in self.room_names:
                 idx = self.room_names.index(room_name)
-                return JSONResponse({"port": self.room_ports[idx], "status": "exist"})
+                return ORJSONResponse({"port": self.room_ports[idx], "status": "exist"})
             else:
                 if None not in self.room_names:
-                    return JSONResponse({"status": "full"})
+                    return ORJSONResponse({"status": "full"})
                 # create new one
                 idx = self.room_names.index(None)
                 init_args = self.init_args.copy()
@@ -214,7 +216,7 @@ class HTTPRoomServer:
                 while True:
                     resp = resp_q.get()
                     if resp == "server failed to start":
-                        return JSONResponse({"status": "failed"})
+                        return ORJSONResponse({"status": "failed"})
                     else:
                         # is port, but may start failed, need to check
                         # whether fail message is sent
@@ -226,7 +228,7 @@ class HTTPRoomServer:
                             self.room_names[idx] = room_name
                             self.room_ports[idx] = int(resp)
                             self.room_active_times[idx] = time.time()
-                            return JSONResponse(
+                            return ORJSONResponse(
                                 {"port": self.room_ports[idx], "status": "created"}
                             )
                         else:
@@ -245,17 +247,17 @@ class HTTPRoomServer:
                 password (str): The password for the admin.
 
             Returns:
-                JSONResponse: The response containing the action status (not exist or
+                ORJSONResponse: The response containing the action status (not exist or
                 deleted).
             """
             if password != self.admin_password:
-                return JSONResponse(status_code=403, content="wrong password")
+                return ORJSONResponse(status_code=403, content="wrong password")
             if room_name not in self.room_names:
-                return JSONResponse({"status": "not exist"}, 404)
+                return ORJSONResponse({"status": "not exist"}, 404)
             else:
                 idx = self.room_names.index(room_name)
                 self._delete_one_room(idx)
-                return JSONResponse({"status": "deleted"})
+                return ORJSONResponse({"status": "deleted"})
 
         @app.get("/rooms")
         def get_rooms(password: str = ""):
@@ -266,11 +268,12 @@ class HTTPRoomServer:
                 password (str): The password for the admin.
 
             Returns:
-                JSONResponse: The response containing the rooms' name, port and timeout.
+                ORJSONResponse: The response containing the rooms' name, port and
+                timeout.
             """
             if password != self.admin_password:
-                return JSONResponse(status_code=403, content="wrong password")
-            return JSONResponse(
+                return ORJSONResponse(status_code=403, content="wrong password")
+            return ORJSONResponse(
                 {
                     "rooms": [
                         {
@@ -295,11 +298,11 @@ class HTTPRoomServer:
                 - password (str): The password for the admin.
 
             Returns:
-                - JSONResponse: The response containing the decks used in rooms.
+                - ORJSONResponse: The response containing the decks used in rooms.
             """
             if password != self.admin_password:
-                return JSONResponse(status_code=403, content="wrong password")
-            return JSONResponse(self.deck_history)
+                return ORJSONResponse(status_code=403, content="wrong password")
+            return ORJSONResponse(self.deck_history)
 
     def _create_room_workers(self):
         max_rooms = self.max_rooms
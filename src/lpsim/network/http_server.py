@@ -5,12 +5,15 @@ import uuid
 import os
 import time
 import datetime
-from typing import Literal, List
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+import threading
+from typing import Any, Dict, Literal, List, Tuple
+from fastapi import FastAPI, HTTPException, Request, WebSocket
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
+import orjson
 import uvicorn
 
 from ..utils.desc_registry import get_desc_patch
@@ -18,10 +21,106 @@ from ..utils.desc_registry import get_desc_patch
 from ..server.match import Match, MatchConfig
 from ..server.deck import Deck
 from ..agents import InteractionAgent
-from .utils import get_new_match
+from .utils import get_new_match, respond_with_agents
 from ..utils.deck_code import deck_code_data
 from .__version__ import __version_tuple__, __version__, __frontend_version__
 
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover
+    # MessagePack payload of state API is optional. If ormsgpack is not installed,
+    # states are always encoded in json.
+    ormsgpack = None
+
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+def encode_states(states: List[Dict[str, Any]], media_type: str) -> bytes:
+    """
+    Encode state list of state API into bytes of target media type. Only json and
+    MessagePack are supported.
+
+    Raises:
+        ValueError: If MessagePack is requested but ormsgpack is not installed.
+    """
+    if media_type == MSGPACK_MEDIA_TYPE:
+        if ormsgpack is None:
+            raise ValueError("ormsgpack is not installed, cannot encode MessagePack.")
+        return ormsgpack.packb(states, option=ormsgpack.OPT_NON_STR_KEYS)
+    return orjson.dumps(states, option=orjson.OPT_NON_STR_KEYS)
+
+
+def parse_state_fields(fields: str) -> List[Tuple[str, ...]]:
+    """
+    Parse comma separated field paths, e.g. `player_tables.dice,round_number`, into
+    list of key tuples. Paths do not contain list indices, and fields in lists are
+    selected for every element.
+    """
+    return [tuple(x.strip().split(".")) for x in fields.split(",") if x.strip()]
+
+
+def project_state(data: Any, paths: List[Tuple[str, ...]]) -> Any:
+    """
+    Keep only the fields in paths of the state dict. Lists are projected
+    element-wise, and when a path ends, the whole sub-tree is kept.
+    """
+    if isinstance(data, list):
+        return [project_state(x, paths) for x in data]
+    if not isinstance(data, dict) or any(len(path) == 0 for path in paths):
+        return data
+    res = {}
+    for key, value in data.items():
+        sub_paths = [path[1:] for path in paths if path[0] == key]
+        if len(sub_paths):
+            res[key] = project_state(value, sub_paths)
+    return res
+
+
+def project_state_diff(diff: List[Any], paths: List[Tuple[str, ...]]) -> List[Any]:
+    """
+    Keep diffs generated by dictdiffer that are related to the fields in paths,
+    i.e. the diff node is a parent or a child of any path. When the node is a
+    parent of all related paths, e.g. `player_tables` or `player_tables.0` for
+    path `player_tables.dice`, values in the diff are projected by the rest of
+    paths, so fields not in paths are not contained.
+    """
+    res = []
+    for d in diff:
+        action, node, values = d
+        if isinstance(node, str):
+            node = node.split(".") if node != "" else []
+        # remove list indices
+        keys = tuple(x for x in node if isinstance(x, str) and not x.isdigit())
+        related_paths = [
+            path for path in paths if path[: len(keys)] == keys[: len(path)]
+        ]
+        if len(related_paths) == 0:
+            continue
+        if any(len(path) <= len(keys) for path in related_paths):
+            # node is the field or its child, keep the whole diff
+            res.append(d)
+            continue
+        sub_paths = [path[len(keys) :] for path in related_paths]
+        if action == "change":
+            values = tuple(project_state(x, sub_paths) for x in values)
+        else:
+            # add or remove, values are list of key and value pairs
+            projected_values = []
+            for key, value in values:
+                if isinstance(key, str):
+                    key_paths = [x[1:] for x in sub_paths if x[0] == key]
+                else:
+                    # list index, project every element by sub paths
+                    key_paths = sub_paths
+                if len(key_paths):
+                    projected_values.append((key, project_state(value, key_paths)))
+            if len(projected_values) == 0:
+                continue
+            values = projected_values
+        res.append((action, d[1], values))
+    return res
+
 
 class EndpointFilter(logging.Filter):
     """Filter class to exclude specific endpoints from log entries."""
@@ -82,6 +181,11 @@ class HTTPServer:
     visibility support now, i.e. everyone can get full information of opponent
     player and system states.
 
+    One server holds one match, and engine steps run in threadpool under the match
+    lock. Shipping the match to other processes on every respond costs more than
+    the step itself, so to use multiple cores, run multiple matches with
+    `HTTPRoomServer`, whose rooms are separate processes.
+
     To check APIs, use /docs or /redoc after run the server.
     """
 
@@ -113,7 +217,7 @@ class HTTPServer:
             excluded_log_endpoints (List[str]): endpoints that will not be logged.
                 Default is ['/request', '/state'].
         """
-        self.app = FastAPI()
+        self.app = FastAPI(default_response_class=ORJSONResponse)
         self.decks = [
             Deck.from_str(deck) if isinstance(deck, str) else deck for deck in decks
         ]
@@ -137,6 +241,22 @@ class HTTPServer:
         self.agent_1 = InteractionAgent(player_idx=1, only_use_command=True)
         # used to record all uploaded deck codes to the server
         self.uploaded_deck_codes = []
+        # engine related handlers are plain `def` and run in the threadpool, so
+        # every access that mutates match, uuid or command history should hold it.
+        self._match_lock = threading.Lock()
+        # encoded results of `/state`. As states never change after generated,
+        # cache is only valid for the same uuid and history length, and cleared
+        # when any of them changes.
+        self._state_cache_version: Tuple[str, int] = ("", -1)
+        # bound in-flight requests that wait for the match lock, so waiting
+        # requests do not occupy all threads of threadpool. respond mutates the
+        # match and is processed one by one.
+        self._respond_semaphore = asyncio.Semaphore(1)
+        self._state_semaphore = asyncio.Semaphore(16)
+        # set when new states may be generated, to wake up websocket connections.
+        # a new event is created after set, see `_notify_state_update`.
+        self._state_event = asyncio.Event()
+        self._state_cache: Dict[Tuple[str, int, str, str | None], bytes] = {}
 
         if len(self.decks) == 0:
             # no deck input at init, create two empty decks.
@@ -154,8 +274,8 @@ class HTTPServer:
             allow_origins=allow_origins,
             # allow_origins=['*'],
             allow_credentials=True,
-            allow_methods=["*"],
-            allow_headers=["*"],
+            allow_methods=["GET", "POST"],
+            allow_headers=["Content-Type", "Accept"],
         )
         # Add the GZipMiddleware to the app
         app.add_middleware(GZipMiddleware)
@@ -166,7 +286,7 @@ class HTTPServer:
             if self.room_name != "" and (
                 "room" not in query_params or query_params["room"] != self.room_name
             ):
-                return JSONResponse(status_code=404, content="Room name wrong")
+                return ORJSONResponse(status_code=404, content="Room name wrong")
             response = await call_next(request)
             return response
 
@@ -241,62 +361,70 @@ class HTTPServer:
                 match: full match state
                 type: "FULL"
             """
-            self.save_log(self.reset_log_save_file)
-            match = self.match
-            fixed_random_seed = data.fixed_random_seed
-            if fixed_random_seed:
-                raise NotImplementedError("fixed_random_seed not supported")
-            match_config = data.match_config
-            if match_config is None:
-                match_config = match.config
-            rich = data.rich_mode
-            match_state = data.match_state
-            match_state_idx = data.match_state_idx
-            if match_state_idx is not None:
-                try:
-                    match = self.match.new_match_from_history(match_state_idx)
-                except AssertionError as e:
-                    raise HTTPException(status_code=404, detail=str(e))
-                self.match = match
-                # remove command history that after match_state_idx. No need to
-                # change match random state and start deck.
-                current_cmd_hist = self.command_history[:]
-                self.command_history = [[], []]
-                for source, target in zip(current_cmd_hist, self.command_history):
-                    for idx, cmd, order in source:
-                        if idx >= match_state_idx:
-                            break
-                        target.append([idx, cmd, order])
-            elif match_state is not None:
-                match = match_state
-                match._save_history()
-                match_state_idx = len(match._history_diff) - 1
-                # when reset by match_state, cannot record history with only
-                # match random state, set to None to notify that cannot save.
-                self.command_history = [[], []]
-                self.match_random_state = None
-                self.start_deck = [
-                    x.player_deck_information for x in match.player_tables
-                ]
-            else:
-                self.match, self.match_random_state = get_new_match(
-                    decks=self.decks,
-                    rich_mode=rich,
-                    match_config=match_config,
-                )
-                match_state_idx = 0
+            result = await run_in_threadpool(reset, data)
+            self._notify_state_update()
+            return result
+
+        def reset(data: ResetData):
+            with self._match_lock:
+                self.save_log(self.reset_log_save_file)
                 match = self.match
-                self.command_history = [[], []]
-                self.start_deck = [
-                    x.player_deck_information for x in match.player_tables
-                ]
-            self.uuid = str(uuid.uuid4())
-            return {
-                "uuid": self.uuid,
-                "idx": match_state_idx,
-                "match": match.dict(),
-                "type": "FULL",
-            }
+                fixed_random_seed = data.fixed_random_seed
+                if fixed_random_seed:
+                    raise NotImplementedError("fixed_random_seed not supported")
+                match_config = data.match_config
+                if match_config is None:
+                    match_config = match.config
+                rich = data.rich_mode
+                match_state = data.match_state
+                match_state_idx = data.match_state_idx
+                if match_state_idx is not None:
+                    try:
+                        match = self.match.new_match_from_history(match_state_idx)
+                    except AssertionError as e:
+                        raise HTTPException(status_code=404, detail=str(e))
+                    self.match = match
+                    # remove command history that after match_state_idx. No need to
+                    # change match random state and start deck.
+                    current_cmd_hist = self.command_history[:]
+                    self.command_history = [[], []]
+                    for source, target in zip(current_cmd_hist, self.command_history):
+                        for idx, cmd, order in source:
+                            if idx >= match_state_idx:
+                                break
+                            target.append([idx, cmd, order])
+                elif match_state is not None:
+                    match = match_state
+                    match._save_history()
+                    match_state_idx = len(match._history_diff) - 1
+                    # when reset by match_state, cannot record history with only
+                    # match random state, set to None to notify that cannot save.
+                    self.command_history = [[], []]
+                    self.match_random_state = None
+                    self.start_deck = [
+                        x.player_deck_information for x in match.player_tables
+                    ]
+                else:
+                    self.match, self.match_random_state = get_new_match(
+                        decks=self.decks,
+                        rich_mode=rich,
+                        match_config=match_config,
+                    )
+                    match_state_idx = 0
+                    match = self.match
+                    self.command_history = [[], []]
+                    self.start_deck = [
+                        x.player_deck_information for x in match.player_tables
+                    ]
+                self.uuid = str(uuid.uuid4())
+                return ORJSONResponse(
+                    {
+                        "uuid": self.uuid,
+                        "idx": match_state_idx,
+                        "match": match.dict(),
+                        "type": "FULL",
+                    }
+                )
 
         @app.get("/deck/{player_idx}")
         async def get_deck(player_idx: int):
@@ -399,17 +527,21 @@ class HTTPServer:
             get deck code data that is needed for generating deckcode in
             frontend.
             """
-            return JSONResponse(deck_code_data)
+            return ORJSONResponse(deck_code_data)
 
         @app.get("/state/{mode}/{state_idx}/{player_idx}")
         async def get_game_state(
             mode: Literal["one", "after"],
             state_idx: int,
             player_idx: int,
+            request: Request,
             uuid: str | None = None,
+            fields: str | None = None,
         ):
             """
-            Return list of state and its index.
+            Return list of state and its index. If `Accept` header contains
+            `application/msgpack` and ormsgpack is installed, states are encoded in
+            MessagePack, otherwise in json.
 
             Args:
                 mode (Literal["one", "after"]): mode of fetching state.
@@ -424,6 +556,11 @@ class HTTPServer:
                 player_idx (int): -1 means fetch complete data; 0 or 1 means fetch data
                     for player idx (currently not implemented)
 
+                fields (str | None): comma separated field paths of match, e.g.
+                    `player_tables.dice,round_number`. If set, only these fields
+                    are contained in full states, and only diffs related to them
+                    are contained in diff states.
+
             Return:
                 list of states. For detail of state dict, refer to `post_reset`.
             """
@@ -443,41 +580,169 @@ class HTTPServer:
                 raise HTTPException(status_code=404, detail="State not found")
             if state_idx == -1:
                 state_idx = len(match._history_diff) - 1
+            media_type = "application/json"
+            if (
+                MSGPACK_MEDIA_TYPE in request.headers.get("accept", "")
+                and ormsgpack is not None
+            ):
+                media_type = MSGPACK_MEDIA_TYPE
             start_time = time.time()
             while time.time() - start_time < self.get_state_timeout:
-                if state_idx > 0 and self.uuid != uuid:
-                    # during waiting data change, uuid changed. new match
-                    # started, return empty result
-                    return JSONResponse([])
-                if state_idx == len(match._history_diff):
+                # snapshot is built in threadpool, as it waits for the match lock
+                # and should not block the event loop.
+                async with self._state_semaphore:
+                    result = await run_in_threadpool(
+                        snapshot_game_state, mode, state_idx, uuid, media_type, fields
+                    )
+                if result is None:
                     # ask for the state after the last state, wait until
                     # timeout to try to get new state
                     await asyncio.sleep(self.get_state_sleeptime)
                     continue
-                result = []
-                if state_idx == 0:
-                    # first is 0, add full state and change state_idx to 1
-                    result = [
-                        {
-                            "uuid": self.uuid,
-                            "idx": state_idx,
-                            "match": match._history[0].dict(),
-                            "type": "FULL",
-                        }
-                    ]
-                    state_idx = 1
-                if mode == "after":
-                    result += [
-                        {
-                            "uuid": self.uuid,
-                            "idx": state_idx + idx,
-                            "match_diff": diff,
-                            "type": "DIFF",
-                        }
-                        for idx, diff in enumerate(match._history_diff[state_idx:])
-                    ]
-                return JSONResponse(result)
-            return JSONResponse([])
+                return Response(content=result[0], media_type=media_type)
+            return Response(
+                content=encode_states([], media_type), media_type=media_type
+            )
+
+        def snapshot_game_state(
+            mode: Literal["one", "after"],
+            state_idx: int,
+            uuid: str | None,
+            media_type: str,
+            fields: str | None,
+        ) -> Tuple[bytes, int] | None:
+            """
+            Call `build_game_state` under the match lock.
+            """
+            with self._match_lock:
+                return build_game_state(mode, state_idx, uuid, media_type, fields)
+
+        def build_game_state(
+            mode: Literal["one", "after"],
+            state_idx: int,
+            uuid: str | None,
+            media_type: str,
+            fields: str | None,
+        ) -> Tuple[bytes, int] | None:
+            """
+            Build the state list of `get_game_state` and encode it into media_type.
+            Return encoded states and the index of the next state that is not
+            generated. If the state of state_idx is not generated yet, return None.
+            Encoded states are cached, and should be called with match lock held.
+            """
+            match = self.match
+            if state_idx > 0 and self.uuid != uuid:
+                # during waiting data change, uuid changed. new match
+                # started, return empty result
+                return encode_states([], media_type), state_idx
+            if state_idx == len(match._history_diff):
+                return None
+            version = (self.uuid, len(match._history_diff))
+            if version != self._state_cache_version:
+                self._state_cache_version = version
+                self._state_cache = {}
+            key = (mode, state_idx, media_type, fields)
+            if key in self._state_cache:
+                return self._state_cache[key], len(match._history_diff)
+            paths = parse_state_fields(fields) if fields is not None else []
+            result: List[Dict[str, Any]] = []
+            if state_idx == 0:
+                # first is 0, add full state and change state_idx to 1
+                if len(paths):
+                    # only top level fields in paths are converted to dict
+                    full_state = project_state(
+                        match._history[0].dict(include={x[0] for x in paths}),
+                        paths,
+                    )
+                else:
+                    full_state = match._history[0].dict()
+                result = [
+                    {
+                        "uuid": self.uuid,
+                        "idx": state_idx,
+                        "match": full_state,
+                        "type": "FULL",
+                    }
+                ]
+                state_idx = 1
+            if mode == "after":
+                result += [
+                    {
+                        "uuid": self.uuid,
+                        "idx": state_idx + idx,
+                        "match_diff": (
+                            project_state_diff(diff, paths) if len(paths) else diff
+                        ),
+                        "type": "DIFF",
+                    }
+                    for idx, diff in enumerate(match._history_diff[state_idx:])
+                ]
+            content = encode_states(result, media_type)
+            self._state_cache[key] = content
+            return content, len(match._history_diff)
+
+        @app.websocket("/ws/{player_idx}")
+        async def websocket_game_state(
+            websocket: WebSocket,
+            player_idx: int,
+            state_idx: int = 0,
+            fields: str | None = None,
+        ):
+            """
+            Push states to client, which replaces polling of `/state`. After
+            connected, states from state_idx are sent, and when match is updated by
+            respond or reset, new states are sent. Every message has the same
+            format as `/state` with mode after. When match is reset, states of the
+            new match are sent from its full state.
+
+            Args:
+                player_idx (int): -1 means fetch complete data; 0 or 1 means fetch data
+                    for player idx (currently not implemented)
+                state_idx (int): index of the first state to send.
+                fields (str | None): fields of match to send, refer to `/state`.
+            """
+            if player_idx != -1:
+                await websocket.close(code=1008, reason="player data not supported")
+                return
+            await websocket.accept()
+            uuid = self.uuid
+            receive = asyncio.ensure_future(websocket.receive())
+            wait_event: asyncio.Future | None = None
+            try:
+                while True:
+                    event = self._state_event
+                    if uuid != self.uuid:
+                        # new match started, send from its full state
+                        uuid = self.uuid
+                        state_idx = 0
+                    async with self._state_semaphore:
+                        result = await run_in_threadpool(
+                            snapshot_game_state,
+                            "after",
+                            state_idx,
+                            uuid,
+                            "application/json",
+                            fields,
+                        )
+                    if result is not None:
+                        content, state_idx = result
+                        await websocket.send_text(content.decode())
+                    wait_event = asyncio.ensure_future(event.wait())
+                    done, _ = await asyncio.wait(
+                        [receive, wait_event], return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if receive in done:
+                        # client should not send message, only check disconnect.
+                        wait_event.cancel()
+                        if receive.result()["type"] == "websocket.disconnect":
+                            break
+                        receive = asyncio.ensure_future(websocket.receive())
+            finally:
+                # sending may raise when client disconnected, do not leave
+                # pending tasks behind.
+                receive.cancel()
+                if wait_event is not None:
+                    wait_event.cancel()
 
         @app.get("/request/{player_idx}")
         async def get_request(player_idx: int):
@@ -492,78 +757,69 @@ class HTTPServer:
             res = self.match.requests
             if player_idx != -1:
                 res = [x for x in res if x.player_idx == player_idx]
-            return JSONResponse([x.dict() for x in res])
+            return ORJSONResponse([x.dict() for x in res])
 
         @app.post("/respond")
         async def post_respond(data: RespondData):
             """
             Receives respond to the request. Respond command string will be sent to
             `InteractionAgent`.
+
+            Return:
+                list of states generated by this respond. Only diffs to the previous
+                state are returned, i.e. all states are DIFF, except the first state
+                of the match, which is FULL. For detail of state dict, refer to
+                `post_reset`. If it is an old respond, empty list is returned.
             """
-            if data.uuid != self.uuid:
-                raise HTTPException(status_code=404, detail="UUID not match")
-            if data.frame_number != -1:
-                # contains frame number, should match with current frame number
-                if data.frame_number + 1 < len(self.match._history_diff):
-                    # old respond, ignore
-                    return JSONResponse([])
-            match = self.match
-            player_idx = data.player_idx
-            command = data.command
-            current_history_length = len(match._history_diff)
-            if not match.need_respond(player_idx):
-                raise HTTPException(status_code=404, detail="Not your turn")
-            if player_idx == 0:
-                agent = self.agent_0
-            elif player_idx == 1:
-                agent = self.agent_1
-            else:
-                raise HTTPException(status_code=404, detail="Player not found")
-            agent.commands = [command]
-            resp = agent.generate_response(match)
-            if resp is None:
-                raise HTTPException(status_code=404, detail="Invalid command")
-            match.respond(resp)
-            match.step()
-            for agent in (self.agent_0, self.agent_1):
-                if (
-                    agent.__class__ != InteractionAgent or len(agent.commands) > 0  # type: ignore  # noqa: E501
-                ):
-                    while match.need_respond(agent.player_idx):
-                        resp = agent.generate_response(match)
-                        assert resp is not None
-                        match.respond(resp)
-                        match.step()
-            # after success respond, save command into command history
-            self.command_history[player_idx].append(
-                [
-                    current_history_length - 1,
-                    command,
-                    len(self.command_history[0] + self.command_history[1]),
-                ]
-            )
-            # generate response
-            ret = []
-            for idx, diff in enumerate(match._history_diff[current_history_length:]):
-                if idx == 0 and current_history_length == 0:
-                    ret.append(
-                        {
-                            "uuid": self.uuid,
-                            "idx": idx + current_history_length,
-                            "match": match._history[0].dict(),
-                            "type": "FULL",
-                        }
-                    )
+            async with self._respond_semaphore:
+                result = await run_in_threadpool(respond, data)
+            self._notify_state_update()
+            return result
+
+        def respond(data: RespondData):
+            with self._match_lock:
+                if data.uuid != self.uuid:
+                    raise HTTPException(status_code=404, detail="UUID not match")
+                if data.frame_number != -1:
+                    # contains frame number, should match with current frame number
+                    if data.frame_number + 1 < len(self.match._history_diff):
+                        # old respond, ignore
+                        return ORJSONResponse([])
+                match = self.match
+                player_idx = data.player_idx
+                command = data.command
+                current_history_length = len(match._history_diff)
+                if not match.need_respond(player_idx):
+                    raise HTTPException(status_code=404, detail="Not your turn")
+                if player_idx == 0:
+                    agent = self.agent_0
+                elif player_idx == 1:
+                    agent = self.agent_1
                 else:
-                    ret.append(
-                        {
-                            "uuid": self.uuid,
-                            "idx": idx + current_history_length,
-                            "match_diff": diff,
-                            "type": "DIFF",
-                        }
-                    )
-            return JSONResponse(ret)
+                    raise HTTPException(status_code=404, detail="Player not found")
+                agent.commands = [command]
+                resp = agent.generate_response(match)
+                if resp is None:
+                    raise HTTPException(status_code=404, detail="Invalid command")
+                match.respond(resp)
+                match.step()
+                respond_with_agents(match, [self.agent_0, self.agent_1])
+                # after success respond, save command into command history
+                self.command_history[player_idx].append(
+                    [
+                        current_history_length - 1,
+                        command,
+                        len(self.command_history[0] + self.command_history[1]),
+                    ]
+                )
+                # generate response. It is built in the same way as state API, so
+                # the encoded states are cached and reused by `/state` and `/ws`.
+                result = build_game_state(
+                    "after", current_history_length, self.uuid, "application/json", None
+                )
+                if result is None:
+                    return ORJSONResponse([])
+                return Response(content=result[0], media_type="application/json")
 
         @app.get("/log")
         def get_log():
@@ -576,6 +832,15 @@ class HTTPServer:
             except Exception as e:
                 raise HTTPException(status_code=500, detail=str(e))
 
+    def _notify_state_update(self):
+        """
+        Wake up websocket connections that wait for new states. It should be called
+        in the event loop after match is changed.
+        """
+        event = self._state_event
+        self._state_event = asyncio.Event()
+        event.set()
+
     def run(self, *argv, **kwargs):
         """
         A wrapper of uvicorn.run
@@ -3,6 +3,7 @@ from typing import Any, List, Tuple
 from ..server.event_handler import OmnipotentGuideEventHandler_3_3
 from ..server.match import Match, MatchConfig
 from ..server.deck import Deck
+from ..agents import AgentBase, InteractionAgent
 
 
 def get_new_match(
@@ -19,9 +20,12 @@ def get_new_match(
 
     Args:
         decks: The decks of players. If its length is zero, will not set decks
-            or start the match.
+            or start the match. Decks are set to the match as is without copy,
+            so callers that create matches repeatedly, e.g. HTTPServer on
+            reset, should parse deck strings once and reuse the Deck objects.
         seed: The random seed. It should follow the format of
-            numpy.RandomState.get_state(legacy=True) or random.Random.getstate().
+            numpy.RandomState.get_state(legacy=True) or random.Random.getstate(),
+            or be `['PCG64']` to use a new numpy PCG64 generator.
         rich_mode: If True, use rich mode, at round start, players is given
             16 omni dice. Mainly used in code testing.
         match_config: The config of the match. If None, use default config.
@@ -67,3 +71,30 @@ def get_new_match(
             match.step()
 
     return match, random_state
+
+
+def respond_with_agents(match: Match, agents: List[AgentBase]) -> None:
+    """
+    Let agents respond to the match and step, until no request can be responded
+    by them. `agents[i]` is the agent of player i. InteractionAgent without
+    commands is waiting for its player, and its requests are skipped.
+
+    It checks requests once per response, instead of calling `need_respond`
+    for every agent and every response. Each time the first request in
+    `match.requests` that its agent can answer is responded, so agents are
+    asked again after other agents responded, e.g. player 0 responds to a
+    request created by the response of player 1. Previously /respond let
+    player 0 and then player 1 respond only once in turn.
+    """
+    while True:
+        for request in match.requests:
+            agent = agents[request.player_idx]
+            if not isinstance(agent, InteractionAgent) or len(agent.commands) > 0:
+                break
+        else:
+            # no request, or all requests are waiting for players
+            return
+        resp = agent.generate_response(match)
+        assert resp is not None
+        match.respond(resp)
+        match.step()
@@ -1,6 +1,7 @@
 from enum import Enum
+from pydantic import Field
 from ..utils import BaseModel
-from typing import Literal, List, Tuple
+from typing import Annotated, Any, Literal, List, Tuple, Union
 from .interaction import (
     ChooseCharacterResponse,
     RerollDiceResponse,
@@ -13,6 +14,15 @@ from .struct import MultipleObjectPosition, ObjectPosition
 
 
 class ActionTypes(str, Enum):
+    """
+    Types of actions, which are also the discriminator of `Actions`.
+
+    Values are kept as str, as they are contained in match states and histories
+    that are sent to frontend and saved in logs. Members are singletons, and str
+    equality checks identity first, so comparing two members does not compare
+    characters.
+    """
+
     EMPTY = "EMPTY"
     DRAW_CARD = "DRAW_CARD"
     RESTORE_CARD = "RESTORE_CARD"
@@ -63,6 +73,10 @@ class ActionBase(BaseModel):
     Base class for game actions.
     An action contains arguments to make changes to the game table.
 
+    Actions stay pydantic models instead of slotted dataclasses, as they are
+    members of the `Actions` discriminated union, and are serialized into
+    event frames and histories and parsed back when a match is loaded.
+
     Attributes:
         action_type (Literal[ActionTypes]): The type of the action.
         record_level (int): The level of the action to record in match.history,
@@ -73,6 +87,17 @@ class ActionBase(BaseModel):
 
     record_level: int = 100
 
+    @classmethod
+    def fast(cls, **kwargs):
+        """
+        Create the action without validation. Only use it when all arguments are
+        generated by engine and already valid, e.g. positions of objects. Note
+        `__init__` of the action is skipped, so do not use it for actions with
+        extra checks in `__init__`, e.g. MakeDamageAction, unless the checks
+        are known to pass.
+        """
+        return cls.construct(**kwargs)
+
 
 class DrawCardAction(ActionBase):
     """
@@ -321,7 +346,7 @@ class CreateRandomObjectAction(ActionBase):
     creating this action.
     """
 
-    type: Literal[ActionTypes.CREATE_OBJECT] = ActionTypes.CREATE_OBJECT
+    type: Literal[ActionTypes.CREATE_RANDOM_OBJECT] = ActionTypes.CREATE_RANDOM_OBJECT
     object_position: ObjectPosition
     object_names: List[str]
     object_arguments: dict
@@ -522,38 +547,61 @@ class SwitchCardAction(ActionBase):
     restore_card_idxs: List[int]
 
 
-Actions = (
-    ActionBase
-    | DrawCardAction
-    | RestoreCardAction
-    | RemoveCardAction
-    | ChooseCharacterAction
-    # 5
-    | CreateDiceAction
-    | RemoveDiceAction
-    | DeclareRoundEndAction
-    | ActionEndAction
-    | SwitchCharacterAction
-    # 10
-    | ChargeAction
-    | UseSkillAction
-    | UseCardAction
-    | SkillEndAction
-    | CharacterDefeatedAction
-    # 15
-    | CreateObjectAction
-    | CreateRandomObjectAction
-    | RemoveObjectAction
-    | ChangeObjectUsageAction
-    | MoveObjectAction
-    # 20
-    | MakeDamageAction
-    | ConsumeArcaneLegendAction
-    | GenerateChooseCharacterRequestAction
-    | GenerateRerollDiceRequestAction
-    | SkipPlayerActionAction
-    # 25
-    | CharacterReviveAction
-    | GenerateSwitchCardRequestAction
-    | SwitchCardAction
-)
+def upgrade_legacy_action(value: Any) -> Any:
+    """
+    CreateRandomObjectAction used the type CREATE_OBJECT in older versions.
+    As `Actions` is discriminated by type, such dicts would be parsed as
+    CreateObjectAction and fail. Map them to CREATE_RANDOM_OBJECT, so saved
+    match states can still be loaded. Use it as a pre validator of fields that
+    contain `Actions`. Other values are returned as is.
+    """
+    if (
+        isinstance(value, dict)
+        and value.get("type") == ActionTypes.CREATE_OBJECT
+        and "object_names" in value
+    ):
+        value = {**value, "type": ActionTypes.CREATE_RANDOM_OBJECT}
+    return value
+
+
+# Actions is discriminated by `type`, so parsing an action only tries the arm
+# with the same type. Every action should have a unique type. Fields with
+# `Actions` should parse with `upgrade_legacy_action` first.
+Actions = Annotated[
+    Union[
+        ActionBase,
+        DrawCardAction,
+        RestoreCardAction,
+        RemoveCardAction,
+        ChooseCharacterAction,
+        # 5
+        CreateDiceAction,
+        RemoveDiceAction,
+        DeclareRoundEndAction,
+        ActionEndAction,
+        SwitchCharacterAction,
+        # 10
+        ChargeAction,
+        UseSkillAction,
+        UseCardAction,
+        SkillEndAction,
+        CharacterDefeatedAction,
+        # 15
+        CreateObjectAction,
+        CreateRandomObjectAction,
+        RemoveObjectAction,
+        ChangeObjectUsageAction,
+        MoveObjectAction,
+        # 20
+        MakeDamageAction,
+        ConsumeArcaneLegendAction,
+        GenerateChooseCharacterRequestAction,
+        GenerateRerollDiceRequestAction,
+        SkipPlayerActionAction,
+        # 25
+        CharacterReviveAction,
+        GenerateSwitchCardRequestAction,
+        SwitchCardAction,
+    ],
+    Field(discriminator="type"),
+]
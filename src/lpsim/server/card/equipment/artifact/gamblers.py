@@ -33,6 +33,9 @@ class GamblersEarrings_3_8(ArtifactBase):
         card is attached to is the active character. If so, create Omni
         Element x2.
         """
+        if self.usage <= 0:
+            # no usage left
+            return []
         target_position = ObjectPosition(
             player_idx=event.action.player_idx,
             # all the following are not used to check, no need to set correctly
@@ -46,12 +49,9 @@ class GamblersEarrings_3_8(ArtifactBase):
         ):
             # not opponent character defeated, or self not active, or self not equipped
             return []
-        if self.usage <= 0:
-            # no usage left
-            return []
         self.usage -= 1
         return [
-            CreateDiceAction(
+            CreateDiceAction.fast(
                 player_idx=self.position.player_idx, number=2, color=DieColor.OMNI
             )
         ]
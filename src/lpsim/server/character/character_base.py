@@ -6,6 +6,7 @@ will break the import loop.
 """
 
 
+from functools import lru_cache
 from typing import List, Literal, Any, Tuple
 from pydantic import validator
 
@@ -31,7 +32,7 @@ from ..consts import (
     CostLabels,
 )
 from ..object_base import ObjectBase, CardBase
-from ..struct import Cost, DeckRestriction, ObjectPosition
+from ..struct import INVALID_POSITION, Cost, DeckRestriction, ObjectPosition
 from ..modifiable_values import DamageValue
 from ..action import (
     ChargeAction,
@@ -48,6 +49,35 @@ from ..card import ArtifactBase
 from ..card import WeaponBase
 
 
+@lru_cache(maxsize=None)
+def _validated_skill_cost(
+    element: ElementType, elemental_dice_number: int, any_dice_number: int, charge: int
+) -> Cost:
+    return Cost(
+        elemental_dice_color=ELEMENT_TO_DIE_COLOR[element],
+        elemental_dice_number=elemental_dice_number,
+        any_dice_number=any_dice_number,
+        charge=charge,
+    )
+
+
+def _skill_cost(
+    element: ElementType,
+    elemental_dice_number: int,
+    any_dice_number: int = 0,
+    charge: int = 0,
+) -> Cost:
+    """
+    Get default skill cost. Costs are validated once per arguments and cached,
+    and a new instance is returned every time, as skills will modify its label
+    and pydantic will not copy it when passed as field value.
+    """
+    cost = _validated_skill_cost(
+        element, elemental_dice_number, any_dice_number, charge
+    )
+    return Cost.construct(**cost.__dict__)
+
+
 class SkillBase(ObjectBase):
     """
     Base class of skills.
@@ -60,11 +90,7 @@ class SkillBase(ObjectBase):
     damage: int
     cost: Cost
     cost_label: int
-    position: ObjectPosition = ObjectPosition(
-        player_idx=-1,
-        area=ObjectPositionType.INVALID,
-        id=-1,
-    )
+    position: ObjectPosition = INVALID_POSITION
 
     def __init__(self, *argv, **kwargs):
         super().__init__(*argv, **kwargs)
@@ -122,20 +148,21 @@ class SkillBase(ObjectBase):
         return character.talent is not None
 
     def create_team_status(self, name: str, args: Any = {}) -> CreateObjectAction:
-        position = ObjectPosition(
+        # player_idx is from validated self position, no need to validate again
+        position = ObjectPosition.construct(
             player_idx=self.position.player_idx,
             area=ObjectPositionType.TEAM_STATUS,
             id=-1,
         )
-        return CreateObjectAction(
-            object_name=name, object_position=position, object_arguments=args
+        return CreateObjectAction.fast(
+            object_name=name, object_position=position, object_arguments=dict(args)
         )
 
     def create_character_status(self, name: str, args: Any = {}) -> CreateObjectAction:
-        return CreateObjectAction(
+        return CreateObjectAction.fast(
             object_name=name,
             object_position=self.position.set_area(ObjectPositionType.CHARACTER_STATUS),
-            object_arguments=args,
+            object_arguments=dict(args),
         )
 
     def create_opposite_character_status(
@@ -153,15 +180,15 @@ class SkillBase(ObjectBase):
         )
 
     def create_summon(self, name: str, args: Any = {}) -> CreateObjectAction:
-        position = ObjectPosition(
+        position = ObjectPosition.construct(
             player_idx=self.position.player_idx, area=ObjectPositionType.SUMMON, id=-1
         )
-        return CreateObjectAction(
-            object_name=name, object_position=position, object_arguments=args
+        return CreateObjectAction.fast(
+            object_name=name, object_position=position, object_arguments=dict(args)
         )
 
     def charge_self(self, charge: int) -> ChargeAction:
-        return ChargeAction(
+        return ChargeAction.fast(
             player_idx=self.position.player_idx,
             character_idx=self.position.character_idx,
             charge=charge,
@@ -177,9 +204,11 @@ class SkillBase(ObjectBase):
         target_table = match.player_tables[1 - self.position.player_idx]
         target_character_idx = target_table.active_character_idx
         target_character = target_table.characters[target_character_idx]
-        return MakeDamageAction(
+        # all fields come from validated objects and damage is positive, so
+        # checks in `__init__` of both models always pass; skip them.
+        return MakeDamageAction.fast(
             damage_value_list=[
-                DamageValue(
+                DamageValue.construct(
                     position=self.position,
                     damage_type=DamageType.DAMAGE,
                     target_position=target_character.position,
@@ -255,11 +284,7 @@ class PhysicalNormalAttackBase(SkillBase):
 
     @staticmethod
     def get_cost(element: ElementType) -> Cost:
-        return Cost(
-            elemental_dice_color=ELEMENT_TO_DIE_COLOR[element],
-            elemental_dice_number=1,
-            any_dice_number=2,
-        )
+        return _skill_cost(element, 1, any_dice_number=2)
 
 
 class ElementalNormalAttackBase(SkillBase):
@@ -274,11 +299,7 @@ class ElementalNormalAttackBase(SkillBase):
 
     @staticmethod
     def get_cost(element: ElementType) -> Cost:
-        return Cost(
-            elemental_dice_color=ELEMENT_TO_DIE_COLOR[element],
-            elemental_dice_number=1,
-            any_dice_number=2,
-        )
+        return _skill_cost(element, 1, any_dice_number=2)
 
 
 class ElementalSkillBase(SkillBase):
@@ -293,10 +314,7 @@ class ElementalSkillBase(SkillBase):
 
     @staticmethod
     def get_cost(element: ElementType) -> Cost:
-        return Cost(
-            elemental_dice_color=ELEMENT_TO_DIE_COLOR[element],
-            elemental_dice_number=3,
-        )
+        return _skill_cost(element, 3)
 
 
 class ElementalBurstBase(SkillBase):
@@ -310,11 +328,7 @@ class ElementalBurstBase(SkillBase):
 
     @staticmethod
     def get_cost(element: ElementType, number: int, charge: int) -> Cost:
-        return Cost(
-            elemental_dice_color=ELEMENT_TO_DIE_COLOR[element],
-            elemental_dice_number=number,
-            charge=charge,
-        )
+        return _skill_cost(element, number, charge=charge)
 
     def get_actions(self, match: Any) -> List[Actions]:
         """
@@ -598,11 +612,7 @@ class CharacterBase(ObjectBase):
     strict_version_validation: bool = False  # default accept higher versions
     version: str
     type: Literal[ObjectType.CHARACTER] = ObjectType.CHARACTER
-    position: ObjectPosition = ObjectPosition(
-        player_idx=-1,
-        area=ObjectPositionType.INVALID,
-        id=-1,
-    )
+    position: ObjectPosition = INVALID_POSITION
 
     element: ElementType
     max_hp: int
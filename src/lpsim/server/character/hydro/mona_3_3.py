@@ -96,6 +96,8 @@ class IllusoryTorrent(PassiveSkillBase):
         """
         if value.action_label & PlayerActionLabels.SWITCH.value == 0:
             return value
+        if self.usage <= 0:
+            return value
         if not self.position.check_position_valid(
             value.position,
             match,
@@ -103,8 +105,6 @@ class IllusoryTorrent(PassiveSkillBase):
             character_idx_same=True,
         ):
             return value
-        if self.usage <= 0:
-            return value
         # as mona is active character, current switch is always combat action
         assert value.do_combat_action
         value.do_combat_action = False
@@ -137,6 +137,10 @@ class ProphecyOfSubmersion_3_3(SkillTalent):
         if value.damage_type != DamageType.DAMAGE:
             # not damage, not modify
             return value
+        if ElementType.HYDRO not in value.reacted_elements:
+            # no hydro reaction, not activate. check it before position, as it
+            # is much cheaper and filters most damages.
+            return value
         if not self.position.check_position_valid(
             value.position,
             match,
@@ -145,9 +149,6 @@ class ProphecyOfSubmersion_3_3(SkillTalent):
             player_idx_same=True,  # self damage
         ):
             return value
-        if ElementType.HYDRO not in value.reacted_elements:
-            # no hydro reaction, not activate
-            return value
         value.damage += 2
         return value
 
@@ -1,3 +1,10 @@
+"""
+Constants and enums of the game. Enums mix in str, so their values appear as
+plain strings in match states, logs and frontend requests, and can be created
+back from these strings. As members are singletons, comparing members of the
+same enum is an identity check, and no faster with IntEnum.
+"""
+
 from enum import Enum
 
 
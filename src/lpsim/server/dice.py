@@ -1,7 +1,8 @@
-from typing import List, Literal
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Literal
 
-from .struct import ObjectPosition
-from .consts import DieColor, ObjectPositionType
+from .struct import INVALID_POSITION, ObjectPosition
+from .consts import DieColor
 from .object_base import ObjectBase, ObjectType
 
 
@@ -9,26 +10,34 @@ class Dice(ObjectBase):
     """
     Class representing dice.
 
+    Colors are kept as a list of `DieColor` members instead of a packed array
+    of color codes. Members are singletons, so the list only holds references,
+    and it is sent to frontend, saved in logs and compared in requests as is.
+
     Attributes:
         colors: list of colors of dice.
     """
 
     name: Literal["Dice"] = "Dice"
-    position: ObjectPosition = ObjectPosition(
-        player_idx=-1,
-        area=ObjectPositionType.INVALID,
-        id=-1,
-    )
+    position: ObjectPosition = INVALID_POSITION
     type: Literal[ObjectType.DICE] = ObjectType.DICE
     colors: List[DieColor] = []
 
     def colors_to_idx(self, colors: List[DieColor]) -> List[int]:
         """
-        Convert colors to idx.
+        Convert colors to idx. Each color takes the first unused die of that
+        color.
+
+        Raises:
+            ValueError: If there are not enough dice of a color.
         """
+        idxs_of_color: Dict[DieColor, Deque[int]] = defaultdict(deque)
+        for idx, color in enumerate(self.colors):
+            idxs_of_color[color].append(idx)
         res: List[int] = []
-        all_c: List[DieColor | None] = list(self.colors)
         for x in colors:
-            res.append(all_c.index(x))
-            all_c[all_c.index(x)] = None
+            idxs = idxs_of_color[x]
+            if len(idxs) == 0:
+                raise ValueError(f"Not enough dice of color {x}.")
+            res.append(idxs.popleft())
         return res
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List, Tuple, Literal
 
 from .character.character_base import CharacterBase
@@ -20,6 +21,41 @@ def check_elemental_reaction(
     """
     Check the elemental reaction based on source and targets.
 
+    Only a handful of (source, targets) combinations exist, so results are
+    cached by `_cached_elemental_reaction`; fresh lists are returned so
+    callers can modify them freely.
+
+    Args:
+        source (ElementType): The element type of attack source.
+        targets (List[ElementType]): The element application of attack targets.
+
+    Returns:
+        Tuple[ElementalReactionType, List[ElementType], List[ElementType]]:
+            The elemental reaction type, the element types that are consumed,
+            and the element applications updated.
+    """
+    reaction, consumed, applied = _cached_elemental_reaction(source, tuple(targets))
+    return reaction, list(consumed), list(applied)
+
+
+@lru_cache(maxsize=None)
+def _cached_elemental_reaction(
+    source: ElementType, targets: Tuple[ElementType, ...]
+) -> Tuple[ElementalReactionType, Tuple[ElementType, ...], Tuple[ElementType, ...]]:
+    """
+    Cached version of `_check_elemental_reaction`, results are stored as
+    tuples to keep them immutable. Invalid inputs raise and are not cached.
+    """
+    reaction, consumed, applied = _check_elemental_reaction(source, list(targets))
+    return reaction, tuple(consumed), tuple(applied)
+
+
+def _check_elemental_reaction(
+    source: ElementType, targets: List[ElementType]
+) -> Tuple[ElementalReactionType, List[ElementType], List[ElementType]]:
+    """
+    Check the elemental reaction based on source and targets.
+
     Args:
         source (ElementType): The element type of attack source.
         targets (List[ElementType]): The element application of attack targets.
@@ -225,9 +225,11 @@ class AfterMakeDamageEventArguments(MakeDamageEventArguments):
     def from_make_damage_event_arguments(
         event_arguments: MakeDamageEventArguments,
     ) -> "AfterMakeDamageEventArguments":
-        return AfterMakeDamageEventArguments(
+        # fields are already validated in make damage event, so skip validation
+        # and only copy the list.
+        return AfterMakeDamageEventArguments.construct(
             action=event_arguments.action,
-            damages=event_arguments.damages,
+            damages=event_arguments.damages[:],
         )
 
 
@@ -1,10 +1,13 @@
 import logging
 from typing import Any, List
 
+from pydantic import validator
+
 from .consts import ObjectPositionType
 from .event import EventArguments
-from .action import Actions
+from .action import Actions, upgrade_legacy_action
 from .struct import ObjectPosition
+from .object_base import get_handler_tables
 from ..utils import BaseModel
 
 
@@ -29,6 +32,10 @@ class EventFrame(BaseModel):
     triggered_objects: List[ObjectPosition] = []
     triggered_actions: List[Actions] = []
 
+    @validator("triggered_actions", each_item=True, pre=True)
+    def parse_triggered_actions(cls, v):
+        return upgrade_legacy_action(v)
+
 
 class EventController(BaseModel):
     frame_list: List[EventFrame] = []
@@ -76,7 +83,7 @@ class EventController(BaseModel):
         if frame.processing_event is None:
             # do one action
             activated_action = frame.triggered_actions.pop(0)
-            logging.info(f"Action activated: {activated_action}")
+            logging.info("Action activated: %s", activated_action)
             event_args = match._act(activated_action)
             match.record_last_action_history()
             self.stack_events(event_args)
@@ -84,7 +91,7 @@ class EventController(BaseModel):
             # do all actions
             event_args = []
             for activated_action in frame.triggered_actions:
-                logging.info(f"Action activated: {activated_action}")
+                logging.info("Action activated: %s", activated_action)
                 event_args += match._act(activated_action)
                 match.record_last_action_history()
             frame.triggered_actions = []
@@ -98,10 +105,11 @@ class EventController(BaseModel):
         assert event_arg is not None
         object_position = frame.triggered_objects.pop(0)
         obj = match.get_object(object_position, event_arg.type)
-        handler_name = f"event_handler_{event_arg.type.name}"
-        func = getattr(obj, handler_name, None)
-        if func is not None:
-            frame.triggered_actions = func(event_arg, match)
+        if obj is not None:
+            handler_name = get_handler_tables(obj.__class__)[0].get(event_arg.type)
+            if handler_name is not None:
+                func = getattr(obj, handler_name)
+                frame.triggered_actions = func(event_arg, match)
         self.frame_list[-1] = frame
 
     def trigger_event(self, event_frame: EventFrame, match: Any) -> None:
@@ -112,20 +120,27 @@ class EventController(BaseModel):
         """
         event_arg = event_frame.events.pop(0)
         event_frame.processing_event = event_arg
+        # use plain str value of the event type in the loops below. It equals
+        # and hashes the same as the enum member, but avoids calling
+        # `Enum.__hash__` on every table lookup.
+        event_type = event_arg.type.value
         object_list = match.get_object_list()
         # add object in trashbin to list
         for obj in match.trashbin:
-            if event_arg.type in obj.available_handler_in_trashbin:
+            if event_type in obj.available_handler_in_trashbin:
                 object_list.append(obj)
-        handler_name = f"event_handler_{event_arg.type.name}"
+        triggered_objects = event_frame.triggered_objects
         for obj in object_list:
+            # most objects do not handle the event, so check handler first
+            if event_type not in get_handler_tables(obj.__class__)[0]:
+                continue
             # for deck objects, check availability
-            if obj.position.area == ObjectPositionType.DECK:
-                if event_arg.type not in obj.available_handler_in_deck:
-                    continue
-            func = getattr(obj, handler_name, None)
-            if func is not None:
-                event_frame.triggered_objects.append(obj.position)
+            if (
+                obj.position.area == ObjectPositionType.DECK
+                and event_type not in obj.available_handler_in_deck
+            ):
+                continue
+            triggered_objects.append(obj.position)
 
     def stack_event(self, event_arg: EventArguments) -> EventFrame:
         """
@@ -139,7 +154,12 @@ class EventController(BaseModel):
         stack new actions, these actions are not triggered by any object, so when any
         action in it is triggered, its event will be triggered immediately.
         """
-        event_frame = EventFrame(events=[], triggered_actions=actions)
+        event_frame = EventFrame.construct(
+            events=[],
+            processing_event=None,
+            triggered_objects=[],
+            triggered_actions=actions,
+        )
         self.frame_list.append(event_frame)
         return event_frame
 
@@ -147,9 +167,16 @@ class EventController(BaseModel):
         """
         stack events. It will create a new EventFrame with events and
         append it into self.event_frames. Then it will return the event frame.
+
+        Events and actions are generated by the match and already validated,
+        so frames are created without validation, and the list is owned by the
+        frame after stacked.
         """
-        frame = EventFrame(
+        frame = EventFrame.construct(
             events=event_args,
+            processing_event=None,
+            triggered_objects=[],
+            triggered_actions=[],
         )
         self.frame_list.append(frame)
         return frame
@@ -2,7 +2,7 @@ import os
 import logging
 import copy
 import random
-from typing import Literal, List, Any, Dict, Tuple
+from typing import Callable, Literal, List, Any, Dict, Tuple
 from enum import Enum
 from pydantic import PrivateAttr, validator
 import dictdiffer
@@ -45,6 +45,7 @@ from .action import (
     ConsumeArcaneLegendAction,
     GenerateSwitchCardRequestAction,
     SwitchCardAction,
+    upgrade_legacy_action,
 )
 from .interaction import (
     Requests,
@@ -111,7 +112,7 @@ from .event import (
     UseSkillEventArguments,
     SwitchCardEventArguments,
 )
-from .object_base import CardBase, ObjectBase
+from .object_base import CardBase, ObjectBase, get_handler_tables
 from .modifiable_values import (
     CombatActionValue,
     FullCostValue,
@@ -120,6 +121,7 @@ from .modifiable_values import (
     ModifiableValueTypes,
     RerollValue,
     CostValue,
+    DamageIncreaseValue,
     DamageMultiplyValue,
     DamageDecreaseValue,
     UseCardValue,
@@ -134,11 +136,13 @@ from .event_handler import SystemEventHandlerBase, SystemEventHandler
 
 try:
     import numpy as np
+
+    _NUMPY_AVAILABLE = True
 except ImportError:  # pragma: no cover
     # in legacy version, we use numpy as random generator. And in newer version, we
     # use random as random generator. If numpy is not installed, we cannot set random
     # state with numpy version states.
-    pass
+    _NUMPY_AVAILABLE = False
 
 
 class MatchState(str, Enum):
@@ -312,6 +316,10 @@ class MatchConfig(BaseModel):
         return True
 
 
+# objects and their modifier names of each value type
+_ValueModifierCache = Dict[ModifiableValueTypes, List[Tuple[ObjectBase, str]]]
+
+
 class Match(BaseModel):
     """ """
 
@@ -343,9 +351,14 @@ class Match(BaseModel):
     _prediction_mode: bool = PrivateAttr(False)
     skill_predictions: List[Any] = []
 
-    # random state
+    # random state. `random_state` is the saved form of `_random_state`, and is
+    # only updated when the match is copied or exported, see
+    # `_sync_random_state`. Empty to use python random, a numpy legacy state
+    # to use numpy RandomState, and `['PCG64']` to use numpy PCG64 generator,
+    # whose state is much smaller to save.
     random_state: List[Any] = []
     _random_state: Any = PrivateAttr(None)
+    _random_state_saved: bool = PrivateAttr(True)
 
     # event handlers to implement special rules.
     event_handlers: List[SystemEventHandlerBase] = [
@@ -373,10 +386,22 @@ class Match(BaseModel):
     # chain cleared, all objects in trashbin will be removed.
     trashbin: List[CharacterStatusBase | TeamStatusBase | CardBase | SummonBase] = []
 
+    # when set, `get_object_list` returns a copy of it instead of collecting
+    # objects again. Only set when objects cannot change, see
+    # `_player_action_request` and `_modify_damage_value`.
+    _object_list_cache: List[ObjectBase] | None = PrivateAttr(None)
+    # objects and their modifier names of each value type, lazily filled
+    # by `_modify_value` when `_object_list_cache` is set.
+    _value_modifier_cache: _ValueModifierCache | None = PrivateAttr(None)
+
     @validator("event_handlers", each_item=True, pre=True)
     def parse_event_handlers(cls, v):
         return get_instance(SystemEventHandlerBase, v)
 
+    @validator("last_action", pre=True)
+    def parse_last_action(cls, v):
+        return upgrade_legacy_action(v)
+
     # @validator('requests', each_item = True, pre = True)
     # def parse_requests(cls, v):
     #     return get_instance(Requests, v)
@@ -441,17 +466,70 @@ class Match(BaseModel):
         """
         Copy the match, and init random state of new match.
         """
+        self._sync_random_state()
         ret = super().copy(*argv, **kwargs)
         ret._init_random_state()
         return ret
 
+    def fork(self, number: int) -> List["Match"]:
+        """
+        Create `number` deep copies of the match with different random states,
+        e.g. to run independent rollouts of AI agents. Forked matches share no
+        objects with each other, so they can be simulated in different threads,
+        or sent to processes by `concurrent.futures.ProcessPoolExecutor`, as
+        matches can be pickled.
+
+        With PCG64 random state, forks use jumped streams of current generator
+        and current match is not changed. Otherwise, seeds of forks are drawn
+        from the random state of current match.
+        """
+        assert (
+            not self.config.recreate_mode
+        ), "In recreate mode, random functions should not be called."
+        if (
+            _NUMPY_AVAILABLE
+            and isinstance(self._random_state, np.random.Generator)
+            and isinstance(self._random_state.bit_generator, np.random.PCG64)
+        ):
+            bit_generator = self._random_state.bit_generator
+            generators = [
+                np.random.Generator(bit_generator.jumped(i + 1)) for i in range(number)
+            ]
+        else:
+            seeds = [int(x * 2**32) for x in self._random_batch(number)]
+            if isinstance(self._random_state, random.Random):
+                generators = [random.Random(seed) for seed in seeds]
+            else:
+                generators = [np.random.RandomState(seed) for seed in seeds]
+        results: List[Match] = []
+        for generator in generators:
+            match = self.copy(deep=True)
+            match._random_state = generator
+            match._save_random_state()
+            results.append(match)
+        return results
+
+    def dict(self, *argv, **kwargs) -> Dict[str, Any]:
+        """
+        Export the match with latest random state.
+        """
+        self._sync_random_state()
+        return super().dict(*argv, **kwargs)
+
+    def json(self, *argv, **kwargs) -> str:
+        """
+        Export the match with latest random state.
+        """
+        self._sync_random_state()
+        return super().json(*argv, **kwargs)
+
     def _init_random_state(self):
         if self.config.recreate_mode:
             # no need to init random state
             return
         if self.random_state:
             if self.random_state[0] == "MT19937":
-                assert "np" in globals(), (
+                assert _NUMPY_AVAILABLE, (
                     "numpy is not installed, cannot set random state with numpy "
                     "version states."
                 )
@@ -459,6 +537,23 @@ class Match(BaseModel):
                 random_state[1] = np.array(random_state[1], dtype="uint32")
                 self._random_state = np.random.RandomState()
                 self._random_state.set_state(random_state)
+            elif self.random_state[0] == "PCG64":
+                assert _NUMPY_AVAILABLE, (
+                    "numpy is not installed, cannot set random state with numpy "
+                    "version states."
+                )
+                self._random_state = np.random.Generator(np.random.PCG64())
+                if len(self.random_state) == 1:
+                    # only type is specified, use the new generator
+                    self._save_random_state()
+                else:
+                    _, state, inc, has_uint32, uinteger = self.random_state
+                    self._random_state.bit_generator.state = {
+                        "bit_generator": "PCG64",
+                        "state": {"state": int(state), "inc": int(inc)},
+                        "has_uint32": has_uint32,
+                        "uinteger": uinteger,
+                    }
             else:
                 random_state = (
                     self.random_state[0],
@@ -471,6 +566,7 @@ class Match(BaseModel):
             # random state not set, create new random state
             self._random_state = random.Random()
             self._save_random_state()
+        self._random_state_saved = True
 
     def _save_history(self) -> None:
         """
@@ -610,25 +706,61 @@ class Match(BaseModel):
         if isinstance(self._random_state, random.Random):
             self.random_state = list(self._random_state.getstate())
             self.random_state[1] = list(self.random_state[1])
-            return
         elif isinstance(self._random_state, np.random.RandomState):
             self.random_state = list(self._random_state.get_state(legacy=True))
             self.random_state[1] = self.random_state[1].tolist()
+        elif isinstance(self._random_state, np.random.Generator):
+            # 128 bit integers are saved as str, as they cannot fit in JSON
+            # number types of most parsers.
+            state = self._random_state.bit_generator.state
+            self.random_state = [
+                "PCG64",
+                str(state["state"]["state"]),
+                str(state["state"]["inc"]),
+                state["has_uint32"],
+                state["uinteger"],
+            ]
         else:
             raise AssertionError(
                 f"Random state type {type(self._random_state)} not recognized."
             )
+        self._random_state_saved = True
+
+    def _sync_random_state(self):
+        """
+        Save the random state if it has changed since last save. Random
+        functions do not save it on every call, as converting the state into
+        list costs much more than generating a random number.
+        """
+        if not self._random_state_saved:
+            self._save_random_state()
 
     def _random(self):
         """
-        Return a random number ranges 0-1 based on random_state, and save new
-        random state.
+        Return a random number ranges 0-1 based on random_state. New random
+        state is saved lazily, see `_sync_random_state`.
         """
         assert (
             not self.config.recreate_mode
         ), "In recreate mode, random functions should not be called."
         ret = self._random_state.random()
-        self._save_random_state()
+        self._random_state_saved = False
+        return ret
+
+    def _random_batch(self, number: int) -> List[float]:
+        """
+        Return `number` random numbers ranges 0-1, which are same as calling
+        `_random` for `number` times. With numpy random state, they are
+        generated in one call.
+        """
+        assert (
+            not self.config.recreate_mode
+        ), "In recreate mode, random functions should not be called."
+        if isinstance(self._random_state, random.Random):
+            ret = [self._random_state.random() for _ in range(number)]
+        else:
+            ret = self._random_state.random(number).tolist()
+        self._random_state_saved = False
         return ret
 
     def _random_shuffle(self, array: List):
@@ -639,7 +771,7 @@ class Match(BaseModel):
             not self.config.recreate_mode
         ), "In recreate mode, random functions should not be called."
         self._random_state.shuffle(array)
-        self._save_random_state()
+        self._random_state_saved = False
 
     def _set_match_state(self, new_state: MatchState):
         logging.info(f"Match state change from {self.state} to " f"{new_state}.")
@@ -757,8 +889,7 @@ class Match(BaseModel):
                     draw_if_filtered_not_enough=False,
                 )
             )
-            event_frame = self.event_controller.stack_events(event_args)
-            self.event_controller.append(event_frame)
+            self.event_controller.stack_events(event_args)
         return True, None
 
     def step(self, run_continuously: bool = True) -> bool:
@@ -792,42 +923,11 @@ class Match(BaseModel):
             elif self.event_controller.has_event():
                 self.event_controller.run_event_frame(self)
             # all response and action are cleared, start state transition
-            elif self.state == MatchState.STARTING:
-                self._set_match_state(MatchState.STARTING_CARD_SWITCH)
-                for player_idx in range(len(self.player_tables)):
-                    self._request_switch_card(player_idx)
-                if self.config.history_level > 0:
-                    self._save_history()
-            elif self.state == MatchState.STARTING_CARD_SWITCH:
-                self._set_match_state(MatchState.STARTING_CHOOSE_CHARACTER)
-                for player_idx in range(len(self.player_tables)):
-                    self._request_choose_character(player_idx)
-                if self.config.history_level > 0:
-                    self._save_history()
-            elif self.state == MatchState.STARTING_CHOOSE_CHARACTER:
-                self._set_match_state(MatchState.GAME_START)
-                self._game_start()
-            elif self.state == MatchState.GAME_START:
-                self._set_match_state(MatchState.ROUND_START)
-                self._round_start()
-            elif self.state == MatchState.ROUND_ROLL_DICE:
-                self._set_match_state(MatchState.ROUND_PREPARING)
-                self._round_prepare()
-            elif self.state == MatchState.ROUND_PREPARING:
-                self._set_match_state(MatchState.PLAYER_ACTION_START)
-                self._player_action_start()
-            elif self.state == MatchState.PLAYER_ACTION_START:
-                self._set_match_state(MatchState.PLAYER_ACTION_REQUEST)
-                self._player_action_request()
-            elif self.state == MatchState.PLAYER_ACTION_REQUEST:
-                # request responded and all action clear
-                self._player_action_end()
-            elif self.state == MatchState.ROUND_ENDING:
-                self._set_match_state(MatchState.ROUND_ENDED)
-                self._round_ending()
-            elif self.state == MatchState.ROUND_ENDED:
-                self._set_match_state(MatchState.ROUND_START)
-                self._round_start()
+            elif self.state in _STATE_TRANSITIONS:
+                next_state, transition = _STATE_TRANSITIONS[self.state]
+                if next_state is not None:
+                    self._set_match_state(next_state)
+                transition(self)
             else:
                 raise NotImplementedError(f"Match state {self.state} not implemented.")
             self.record_last_action_history()
@@ -836,8 +936,9 @@ class Match(BaseModel):
             if len(self.requests) or not run_continuously:
                 if len(self.requests):
                     logging.info(
-                        f'{len(self.requests)} requests generated, '
-                        f'{", ".join([req.name for req in self.requests])}'
+                        "%d requests generated, %s",
+                        len(self.requests),
+                        ", ".join([req.name for req in self.requests]),
                     )
                 return True
 
@@ -845,8 +946,19 @@ class Match(BaseModel):
         """
         Check if the request is valid.
         """
+        # agents usually respond with the request object in self.requests,
+        # so check identity before the costly field-by-field comparison.
         for req in self.requests:
-            if req == request:
+            if req is request:
+                return True
+        # request may be a copy, e.g. parsed from network. Compare cheap fields
+        # first to skip most requests.
+        for req in self.requests:
+            if (
+                req.name == request.name
+                and req.player_idx == request.player_idx
+                and req == request
+            ):
                 return True
         return False
 
@@ -861,7 +973,7 @@ class Match(BaseModel):
         When respond is done, it will generate event frames. Once there is no
         request, Call `self.step()` to continue simulation.
         """
-        logging.info(f"Response received: {response}")
+        logging.info("Response received: %s", response)
         if len(self.requests) == 0:
             raise ValueError("Match is not waiting for response.")
         # check if the response is valid
@@ -902,7 +1014,9 @@ class Match(BaseModel):
         Returns:
             bool: True if game reaches end condition, False otherwise.
         """
-        # all characters are defeated
+        # all characters are defeated. scan stops at the first alive character,
+        # which is usually the first one, so no alive count is kept in tables,
+        # which would need to sync with defeat, revive and loaded states.
         for pnum, table in enumerate(self.player_tables):
             for character in table.characters:
                 if character.is_alive:
@@ -917,6 +1031,24 @@ class Match(BaseModel):
             return True
         return False
 
+    def _starting_card_switch(self):
+        """
+        Generate switch card requests of all players when match starts.
+        """
+        for player_idx in range(len(self.player_tables)):
+            self._request_switch_card(player_idx)
+        if self.config.history_level > 0:
+            self._save_history()
+
+    def _starting_choose_character(self):
+        """
+        Generate choose character requests of all players when match starts.
+        """
+        for player_idx in range(len(self.player_tables)):
+            self._request_choose_character(player_idx)
+        if self.config.history_level > 0:
+            self._save_history()
+
     def _game_start(self):
         """
         Game started. Will send game start event.
@@ -993,7 +1125,7 @@ class Match(BaseModel):
         event_arg = RoundPrepareEventArguments(
             player_go_first=self.current_player,
             round=self.round_number,
-            dice_colors=[table.dice.colors.copy() for table in self.player_tables],
+            dice_colors=[table.dice.colors for table in self.player_tables],
         )
         event_frame = self.event_controller.stack_event(event_arg)
         logging.info(
@@ -1001,15 +1133,17 @@ class Match(BaseModel):
             f"handlers triggered."
         )
 
+    def _all_declare_end(self) -> bool:
+        """
+        Whether all players have declared round end.
+        """
+        return all(table.has_round_ended for table in self.player_tables)
+
     def _player_action_start(self):
         """
         Start a player's action phase. Will generate action phase start event.
         """
-        not_all_declare_end = False
-        for table in self.player_tables:
-            if not table.has_round_ended:
-                not_all_declare_end = True
-        assert not_all_declare_end, "All players have declared round end."
+        assert not self._all_declare_end(), "All players have declared round end."
         event = PlayerActionStartEventArguments(player_idx=self.current_player)
         self.event_controller.stack_event(event)
 
@@ -1033,12 +1167,19 @@ class Match(BaseModel):
         # update charge condition
         table = self.player_tables[self.current_player]
         table.charge_satisfied = len(table.dice.colors) % 2 == 0
-        # generate requests
-        self._request_switch_character(self.current_player)
-        self._request_elemental_tuning(self.current_player)
-        self._request_declare_round_end(self.current_player)
-        self._request_use_skill(self.current_player)
-        self._request_use_card(self.current_player)
+        # generate requests. They only read tables and modify costs in TEST
+        # mode, which never changes objects, so collect objects only once.
+        self._object_list_cache = self.get_object_list()
+        self._value_modifier_cache = {}
+        try:
+            self._request_switch_character(self.current_player)
+            self._request_elemental_tuning(self.current_player)
+            self._request_declare_round_end(self.current_player)
+            self._request_use_skill(self.current_player)
+            self._request_use_card(self.current_player)
+        finally:
+            self._object_list_cache = None
+            self._value_modifier_cache = None
         self._predict_skill(self.current_player)
         if self.config.history_level > 0:
             self._save_history()
@@ -1047,12 +1188,7 @@ class Match(BaseModel):
         """
         End a player's action phase. Will check status and go to proper state.
         """
-        all_declare_end = True
-        for table in self.player_tables:
-            if not table.has_round_ended:
-                all_declare_end = False
-                break
-        if all_declare_end:
+        if self._all_declare_end():
             # all declare ended, go to round ending
             self._set_match_state(MatchState.ROUND_ENDING)
         else:
@@ -1116,6 +1252,8 @@ class Match(BaseModel):
                 the list.
         4. system event handler
         """
+        if self._object_list_cache is not None:
+            return self._object_list_cache[:]
         return (
             self.player_tables[self.current_player].get_object_lists()
             + self.player_tables[1 - self.current_player].get_object_lists()
@@ -1141,20 +1279,45 @@ class Match(BaseModel):
                 related to the value is executed.
         """
         if mode == "TEST":
-            assert value.type in [
+            assert value.type in (
                 ModifiableValueTypes.COST,
                 ModifiableValueTypes.FULL_COST,
-            ], "Only costs can be modified in test mode."
-        object_list = self.get_object_list()
-        modifier_name = f"value_modifier_{value.type.name}"
-        for obj in object_list:
-            name = obj.__class__.__name__
-            if hasattr(obj, "name"):  # pragma: no cover
-                name = obj.name  # type: ignore
-            func = getattr(obj, modifier_name, None)
-            if func is not None:
-                logging.debug(f"Modify value {value.type.name} for {name}.")
-                value = func(value, self, mode)
+            ), "Only costs can be modified in test mode."
+        value_type = value.type
+        cache = self._value_modifier_cache
+        if cache is not None and value_type in cache:
+            modifiers = cache[value_type]
+        else:
+            # only keep objects that can modify this type of value
+            modifiers = []
+            for obj in self.get_object_list():
+                modifier_name = get_handler_tables(obj.__class__)[1].get(value_type)
+                if modifier_name is not None:
+                    modifiers.append((obj, modifier_name))
+            if cache is not None:
+                cache[value_type] = modifiers
+        for obj, modifier_name in modifiers:
+            func = getattr(obj, modifier_name)
+            # all objects in object list are ObjectBase, which always has name
+            logging.debug("Modify value %s for %s.", value.type.name, obj.name)
+            value = func(value, self, mode)
+
+    def _modify_damage_value(self, damage: DamageIncreaseValue) -> DamageDecreaseValue:
+        """
+        Apply 3-step damage modification, i.e. increase, multiply and decrease,
+        in REAL mode. Value modifiers only change their own states and never
+        add or remove objects, so objects are collected once for all steps.
+        """
+        self._object_list_cache = self.get_object_list()
+        try:
+            self._modify_value(damage, "REAL")
+            multiply_damage = DamageMultiplyValue.from_increase_value(damage)
+            self._modify_value(multiply_damage, "REAL")
+            decrease_damage = DamageDecreaseValue.from_multiply_value(multiply_damage)
+            self._modify_value(decrease_damage, "REAL")
+        finally:
+            self._object_list_cache = None
+        return decrease_damage
 
     def _modify_cost_value(
         self,
@@ -1230,6 +1393,9 @@ class Match(BaseModel):
     Request functions. To generate specific requests.
     """
 
+    # Note: list fields of requests are rebuilt by pydantic validation, so dice
+    # colors of table are passed to requests directly without copy.
+
     def _request_switch_card(self, player_idx: int):
         """
         Generate switch card requests.
@@ -1246,10 +1412,13 @@ class Match(BaseModel):
         Generate switch card requests.
         """
         table = self.player_tables[player_idx]
-        available: List[int] = []
-        for cnum, character in enumerate(table.characters):
-            if character.is_alive:
-                available.append(cnum)
+        # alive state is read from characters directly, as it is changed by
+        # defeat and revive, and can also be set in loaded states.
+        available = [
+            cnum
+            for cnum, character in enumerate(table.characters)
+            if character.is_alive
+        ]
         self.requests.append(
             ChooseCharacterRequest(
                 player_idx=player_idx, available_character_idxs=available
@@ -1266,7 +1435,7 @@ class Match(BaseModel):
         self.requests.append(
             RerollDiceRequest(
                 player_idx=player_idx,
-                colors=player_table.dice.colors.copy(),
+                colors=player_table.dice.colors,
                 reroll_times=reroll_number,
             )
         )
@@ -1276,9 +1445,12 @@ class Match(BaseModel):
         Generate switch character requests.
         """
         table = self.player_tables[player_idx]
-        active_character = table.characters[table.active_character_idx]
+        active_character_idx = table.active_character_idx
+        active_character = table.characters[active_character_idx]
+        dice_colors = table.dice.colors
+        charge, arcane_legend = table.get_charge_and_arcane_legend()
         for cidx, character in enumerate(table.characters):
-            if cidx == table.active_character_idx or character.is_defeated:
+            if cidx == active_character_idx or character.is_defeated:
                 continue
             dice_cost = Cost(any_dice_number=1)
             dice_cost.label = CostLabels.SWITCH_CHARACTER.value
@@ -1288,9 +1460,8 @@ class Match(BaseModel):
                 target_position=character.position,
             )
             dice_cost_value = self._modify_cost_value(dice_cost_value, mode="TEST")
-            charge, arcane_legend = table.get_charge_and_arcane_legend()
             if not dice_cost_value.cost.is_valid(
-                dice_colors=table.dice.colors,
+                dice_colors=dice_colors,
                 charge=charge,
                 arcane_legend=arcane_legend,
                 strict=False,
@@ -1299,32 +1470,39 @@ class Match(BaseModel):
             self.requests.append(
                 SwitchCharacterRequest(
                     player_idx=player_idx,
-                    active_character_idx=table.active_character_idx,
+                    active_character_idx=active_character_idx,
                     target_character_idx=cidx,
-                    dice_colors=table.dice.colors.copy(),
+                    dice_colors=dice_colors,
                     cost=dice_cost_value.cost,
                 )
             )
 
     def _request_elemental_tuning(self, player_idx: int):
         table = self.player_tables[player_idx]
-        target_color = ELEMENT_TO_DIE_COLOR[
-            table.characters[table.active_character_idx].element
-        ]
-        available_dice_idx = [
-            didx
-            for didx, color in enumerate(table.dice.colors)
-            if color != target_color and color != DieColor.OMNI
-        ]
+        if len(table.hands) == 0:
+            # no card to tune, no need to check dice
+            return
         if self.config.recreate_mode:
             # in recreate mode, all dice can be tuned
             available_dice_idx = list(range(len(table.dice.colors)))
+        else:
+            not_tunable = (
+                ELEMENT_TO_DIE_COLOR[
+                    table.characters[table.active_character_idx].element
+                ],
+                DieColor.OMNI,
+            )
+            available_dice_idx = [
+                didx
+                for didx, color in enumerate(table.dice.colors)
+                if color not in not_tunable
+            ]
         available_card_idxs = list(range(len(table.hands)))
-        if len(available_dice_idx) and len(available_card_idxs):
+        if len(available_dice_idx):
             self.requests.append(
                 ElementalTuningRequest(
                     player_idx=player_idx,
-                    dice_colors=table.dice.colors.copy(),
+                    dice_colors=table.dice.colors,
                     dice_idxs=available_dice_idx,
                     card_idxs=available_card_idxs,
                 )
@@ -1340,30 +1518,26 @@ class Match(BaseModel):
         request.
         """
         table = self.player_tables[player_idx]
-        front_character = table.characters[table.active_character_idx]
+        active_character_idx = table.active_character_idx
+        front_character = table.characters[active_character_idx]
         if front_character.is_stunned:
             # stunned, cannot use skill.
             return
+        dice_colors = table.dice.colors
         for sid, skill in enumerate(front_character.skills):
             if skill.is_valid(self):
                 cost = skill.cost.copy()
-                if (
-                    skill.skill_type == SkillType.NORMAL_ATTACK
-                    and table.charge_satisfied
-                ):
-                    # normal attack and satisfy charge, charge attack.
-                    cost.label |= CostLabels.CHARGED_ATTACK.value
-                if (
-                    skill.skill_type == SkillType.NORMAL_ATTACK
-                    and table.plunge_satisfied
-                ):
-                    # normal attack and satisfy plunge, plunge attack.
-                    cost.label |= CostLabels.PLUNGING_ATTACK.value
+                if skill.skill_type == SkillType.NORMAL_ATTACK:
+                    if table.charge_satisfied:
+                        # normal attack and satisfy charge, charge attack.
+                        cost.label |= CostLabels.CHARGED_ATTACK.value
+                    if table.plunge_satisfied:
+                        # normal attack and satisfy plunge, plunge attack.
+                        cost.label |= CostLabels.PLUNGING_ATTACK.value
                 cost_value = CostValue(
                     cost=cost, position=skill.position, target_position=None
                 )
                 cost_value = self._modify_cost_value(cost_value, "TEST")
-                dice_colors = table.dice.colors
                 if cost_value.cost.is_valid(
                     dice_colors=dice_colors,
                     charge=front_character.charge,
@@ -1373,9 +1547,9 @@ class Match(BaseModel):
                     self.requests.append(
                         UseSkillRequest(
                             player_idx=player_idx,
-                            character_idx=table.active_character_idx,
+                            character_idx=active_character_idx,
                             skill_idx=sid,
-                            dice_colors=dice_colors.copy(),
+                            dice_colors=dice_colors,
                             cost=cost_value.cost,
                         )
                     )
@@ -1383,6 +1557,8 @@ class Match(BaseModel):
     def _request_use_card(self, player_idx: int):
         table = self.player_tables[player_idx]
         cards = table.hands
+        dice_colors = table.dice.colors
+        charge, arcane_legend = table.get_charge_and_arcane_legend()
         for cid, card in enumerate(cards):
             if card.is_valid(self):
                 cost = card.cost.copy()
@@ -1390,8 +1566,6 @@ class Match(BaseModel):
                     cost=cost, position=card.position, target_position=None
                 )
                 cost_value = self._modify_cost_value(cost_value, "TEST")
-                dice_colors = table.dice.colors
-                charge, arcane_legend = table.get_charge_and_arcane_legend()
                 if cost_value.cost.is_valid(
                     dice_colors=dice_colors,
                     charge=charge,
@@ -1402,7 +1576,7 @@ class Match(BaseModel):
                         UseCardRequest(
                             player_idx=player_idx,
                             card_idx=cid,
-                            dice_colors=dice_colors.copy(),
+                            dice_colors=dice_colors,
                             cost=cost_value.cost,
                             targets=list(card.get_targets(self)),
                         )
@@ -1412,6 +1586,23 @@ class Match(BaseModel):
     Response functions. To deal with specific responses.
     """
 
+    def _remove_player_requests(self, player_idx: int) -> None:
+        """
+        Remove all requests of a player after the player responded. Requests
+        are a field of the match and are sent to frontend, so they are kept as
+        one list, and only rebuilt when other players still have requests.
+        """
+        requests = self.requests
+        for req in requests:
+            if req.player_idx != player_idx:
+                break
+        else:
+            # all requests belong to the player, which is the most common case.
+            # assign a new list, as callers may still iterate the old one.
+            self.requests = []
+            return
+        self.requests = [req for req in requests if req.player_idx != player_idx]
+
     def _respond_switch_card(self, response: SwitchCardResponse):
         if self.version <= "0.0.4":
             return self._respond_switch_card_004(response)
@@ -1427,12 +1618,9 @@ class Match(BaseModel):
                 restore_card_idxs=response.card_idxs,
             )
         )
-        event_frame = self.event_controller.stack_events(event_args)
-        self.event_controller.append(event_frame)
+        self.event_controller.stack_events(event_args)
         # remove related requests
-        self.requests = [
-            req for req in self.requests if req.player_idx != response.player_idx
-        ]
+        self._remove_player_requests(response.player_idx)
 
     def _respond_switch_card_004(self, response: SwitchCardResponse):
         """
@@ -1453,20 +1641,15 @@ class Match(BaseModel):
                 draw_if_filtered_not_enough=True,
             )
         )
-        event_frame = self.event_controller.stack_events(event_args)
-        self.event_controller.append(event_frame)
+        self.event_controller.stack_events(event_args)
         # remove related requests
-        self.requests = [
-            req for req in self.requests if req.player_idx != response.player_idx
-        ]
+        self._remove_player_requests(response.player_idx)
 
     def _respond_choose_character(self, response: ChooseCharacterResponse):
         event_args = self._act(ChooseCharacterAction.from_response(response))
         self.event_controller.stack_events(event_args)
         # remove related requests
-        self.requests = [
-            req for req in self.requests if req.player_idx != response.player_idx
-        ]
+        self._remove_player_requests(response.player_idx)
 
     def _respond_reroll_dice(self, response: RerollDiceResponse):
         """
@@ -1474,18 +1657,20 @@ class Match(BaseModel):
         keep request and only substrat reroll times. If there are no reroll
         times left, remove request.
         """
-        event_args = self._action_remove_dice(RemoveDiceAction.from_response(response))
-        event_frame = self.event_controller.stack_events(list(event_args))
-        self.event_controller.append(event_frame)
-        event_args = self._action_create_dice(
+        remove_event_args = self._action_remove_dice(
+            RemoveDiceAction.from_response(response)
+        )
+        create_event_args = self._action_create_dice(
             CreateDiceAction(
                 player_idx=response.player_idx,
                 number=len(response.reroll_dice_idxs),
                 random=True,
             )
         )
-        event_frame = self.event_controller.stack_events(list(event_args))
-        self.event_controller.append(event_frame)
+        # stack events in one frame. create events go first, same as when
+        # they were stacked in a frame above remove events.
+        event_args: List[EventArguments] = [*create_event_args, *remove_event_args]
+        self.event_controller.stack_events(event_args)
         # modify request
         for num, req in enumerate(self.requests):  # pragma: no branch
             if isinstance(req, RerollDiceRequest):  # pragma: no branch
@@ -1548,9 +1733,7 @@ class Match(BaseModel):
         end_action.do_combat_action = combat_action_value.do_combat_action
         actions.append(end_action)
         self.event_controller.stack_actions(actions)
-        self.requests = [
-            x for x in self.requests if x.player_idx != response.player_idx
-        ]
+        self._remove_player_requests(response.player_idx)
 
     def _respond_elemental_tuning(self, response: ElementalTuningResponse):
         """
@@ -1587,9 +1770,7 @@ class Match(BaseModel):
             )
         )
         self.event_controller.stack_actions(actions)
-        self.requests = [
-            x for x in self.requests if x.player_idx != response.player_idx
-        ]
+        self._remove_player_requests(response.player_idx)
 
     def _respond_declare_round_end(self, response: DeclareRoundEndResponse):
         """
@@ -1608,9 +1789,7 @@ class Match(BaseModel):
             )
         )
         self.event_controller.stack_actions(actions)
-        self.requests = [
-            x for x in self.requests if x.player_idx != response.player_idx
-        ]
+        self._remove_player_requests(response.player_idx)
 
     def _respond_use_skill(self, response: UseSkillResponse):
         request = response.request
@@ -1646,9 +1825,7 @@ class Match(BaseModel):
             ),
         ]
         self.event_controller.stack_actions(actions)
-        self.requests = [
-            x for x in self.requests if x.player_idx != response.player_idx
-        ]
+        self._remove_player_requests(response.player_idx)
 
     def _respond_use_card(self, response: UseCardResponse):
         request = response.request
@@ -1677,9 +1854,7 @@ class Match(BaseModel):
             )
         )
         self.event_controller.stack_actions(actions)
-        self.requests = [
-            x for x in self.requests if x.player_idx != response.player_idx
-        ]
+        self._remove_player_requests(response.player_idx)
 
     """
     Action Functions
@@ -1696,68 +1871,25 @@ class Match(BaseModel):
         however we use list to make it compatible with future changes.
 
         Returns:
-            A list of triggered event arguments. We wrap the returned event
-            arguments of action functions in a list to avoid error from linter.
+            A list of triggered event arguments. Action functions always build
+            a new list, so it is returned directly without copying. Their
+            results are typed as `List[Any]` in `_ACTION_FUNCTIONS`, which
+            is assignable to the return type.
         """
         self.last_action = action
         self.action_info = {}
-        if isinstance(action, ChooseCharacterAction):
-            return list(self._action_choose_character(action))
-        elif isinstance(action, CreateDiceAction):
-            return list(self._action_create_dice(action))
-        elif isinstance(action, RemoveDiceAction):
-            return list(self._action_remove_dice(action))
-        elif isinstance(action, RestoreCardAction):
-            return list(self._action_restore_card(action))
-        elif isinstance(action, DrawCardAction):
-            return list(self._action_draw_card(action))
-        elif isinstance(action, RemoveCardAction):
-            return list(self._action_remove_card(action))
-        elif isinstance(action, SwitchCardAction):
-            return list(self._action_switch_card(action))
-        elif isinstance(action, SwitchCharacterAction):
-            return list(self._action_switch_character(action))
-        elif isinstance(action, DeclareRoundEndAction):
-            return list(self._action_declare_round_end(action))
-        elif isinstance(action, ActionEndAction):
-            return list(self._action_action_end(action))
-        elif isinstance(action, MakeDamageAction):
-            return list(self._action_make_damage(action))
-        elif isinstance(action, ChargeAction):
-            return list(self._action_charge(action))
-        elif isinstance(action, UseSkillAction):
-            return list(self._action_use_skill(action))
-        elif isinstance(action, UseCardAction):
-            return list(self._action_use_card(action))
-        elif isinstance(action, SkillEndAction):
-            return list(self._action_skill_end(action))
-        elif isinstance(action, CharacterDefeatedAction):
-            return list(self._action_character_defeated(action))
-        elif isinstance(action, CreateObjectAction):
-            return list(self._action_create_object(action))
-        elif isinstance(action, CreateRandomObjectAction):
-            return list(self._action_create_random_object(action))
-        elif isinstance(action, RemoveObjectAction):
-            return list(self._action_remove_object(action))
-        elif isinstance(action, ChangeObjectUsageAction):
-            return list(self._action_change_object_usage(action))
-        elif isinstance(action, MoveObjectAction):
-            return list(self._action_move_object(action))
-        elif isinstance(action, ConsumeArcaneLegendAction):
-            return list(self._action_consume_arcane_legend(action))
-        elif isinstance(action, GenerateChooseCharacterRequestAction):
-            return list(self._action_generate_choose_character_request(action))
-        elif isinstance(action, GenerateRerollDiceRequestAction):
-            return list(self._action_generate_reroll_dice_request(action))
-        elif isinstance(action, SkipPlayerActionAction):
-            return list(self._action_skip_player_action(action))
-        elif isinstance(action, CharacterReviveAction):
-            return list(self._action_character_revive(action))
-        elif isinstance(action, GenerateSwitchCardRequestAction):
-            return list(self._action_generate_switch_card_request(action))
-        else:
-            self._set_match_state(MatchState.ERROR)  # pragma no cover
-            raise AssertionError(f"Unknown action {action}.")
+        action_function = _ACTION_FUNCTIONS.get(type(action))
+        if action_function is None:
+            # subclass of an action, find its parent class and cache it
+            for cls in type(action).__mro__:
+                if cls in _ACTION_FUNCTIONS:
+                    action_function = _ACTION_FUNCTIONS[cls]
+                    _ACTION_FUNCTIONS[type(action)] = action_function
+                    break
+            else:
+                self._set_match_state(MatchState.ERROR)  # pragma no cover
+                raise AssertionError(f"Unknown action {action}.")
+        return action_function(self, action)
 
     def _action_draw_card(self, action: DrawCardAction) -> List[DrawCardEventArguments]:
         """
@@ -1857,12 +1989,14 @@ class Match(BaseModel):
                 black_card_idxs = black_card_idxs[length:]
             target_card_idxs = target_card_idxs[:number]
         else:
-            # no filter
+            # no filter. deck is already shuffled, draw from top
             target_card_idxs = list(range(min(len(deck), number)))
+        # drawn cards keep their order in deck
+        target_idx_set = set(target_card_idxs)
         new_deck: list[CardBase] = []
         drawn_cards: list[CardBase] = []
         for idx, card in enumerate(table.table_deck):
-            if idx in target_card_idxs:
+            if idx in target_idx_set:
                 drawn_cards.append(card)
             else:
                 new_deck.append(card)
@@ -1872,9 +2006,13 @@ class Match(BaseModel):
             card.position = card.position.set_area(ObjectPositionType.HAND)
         table.hands.extend(drawn_cards)
         logging.info(
-            f"Draw card action, player {player_idx}, number {number}, "
-            f"cards {names}, "
-            f"deck size {len(table.table_deck)}, hand size {len(table.hands)}"
+            "Draw card action, player %s, number %s, cards %s, "
+            "deck size %d, hand size %d",
+            player_idx,
+            number,
+            names,
+            len(table.table_deck),
+            len(table.hands),
         )
         event_arg = DrawCardEventArguments(
             action=action,
@@ -1973,9 +2111,13 @@ class Match(BaseModel):
             card.position = card.position.set_area(ObjectPositionType.HAND)
         table.hands.extend(draw_cards)
         logging.info(
-            f"Draw card action, player {player_idx}, number {number}, "
-            f"cards {names}, "
-            f"deck size {len(table.table_deck)}, hand size {len(table.hands)}"
+            "Draw card action, player %s, number %s, cards %s, "
+            "deck size %d, hand size %d",
+            player_idx,
+            number,
+            names,
+            len(table.table_deck),
+            len(table.hands),
         )
         event_arg = DrawCardEventArguments(
             action=action,
@@ -2022,29 +2164,36 @@ class Match(BaseModel):
             self._random_shuffle(numbers)
             action.card_idxs.sort()
             self._random_shuffle(action.card_idxs)
-        numbers = numbers[-len(action.card_idxs) :]  # restored card positions in deck
-        new_hand = []
-        restored_cards = []
-        new_deck = []
-        for idx in action.card_idxs:
-            restored_cards.append(table.hands[idx])
-        for idx, card in enumerate(table.hands):
-            if idx not in action.card_idxs:
-                new_hand.append(card)
+        # restored card positions in deck
+        restore_positions = set(numbers[-len(action.card_idxs) :])
+        restore_idxs = set(action.card_idxs)
+        restored_cards = [table.hands[idx] for idx in action.card_idxs]
+        new_hand = [
+            card for idx, card in enumerate(table.hands) if idx not in restore_idxs
+        ]
         for card in restored_cards:
             card.position = card.position.set_area(ObjectPositionType.DECK)
         card_names = [x.name for x in restored_cards]
+        # fill the new deck in order, from restored cards at restore positions
+        # and from original deck otherwise.
+        restored_iter = iter(restored_cards)
+        deck_iter = iter(table.table_deck)
+        new_deck: List[CardBase] = []
         for new_deck_idx in range(number_after_restore):
-            if new_deck_idx in numbers:
-                new_deck.append(restored_cards.pop(0))
+            if new_deck_idx in restore_positions:
+                new_deck.append(next(restored_iter))
             else:
-                new_deck.append(table.table_deck.pop(0))
+                new_deck.append(next(deck_iter))
         table.hands = new_hand
         table.table_deck = new_deck
         logging.info(
-            f"Restore card action, player {player_idx}, "
-            f"number {len(action.card_idxs)}, cards: {card_names}, "
-            f"deck size {len(table.table_deck)}, hand size {len(table.hands)}"
+            "Restore card action, player %s, number %s, cards: %s, "
+            "deck size %d, hand size %d",
+            player_idx,
+            len(action.card_idxs),
+            card_names,
+            len(table.table_deck),
+            len(table.hands),
         )
         event_arg = RestoreCardEventArguments(action=action, card_names=card_names)
         return [event_arg]
@@ -2059,11 +2208,12 @@ class Match(BaseModel):
         table = self.player_tables[player_idx]
         card_idxs = action.card_idxs[:]
         card_idxs.sort(reverse=True)  # reverse order to avoid index error
-        card_names = [table.hands[cidx].name for cidx in card_idxs]
         restore_cards: List[CardBase] = []
+        card_names: List[str] = []
         for cidx in card_idxs:
-            restore_cards.append(table.hands[cidx])
-            table.hands = table.hands[:cidx] + table.hands[cidx + 1 :]
+            card = table.hands.pop(cidx)
+            restore_cards.append(card)
+            card_names.append(card.name)
         for card in restore_cards:
             card.position = card.position.set_area(ObjectPositionType.DECK)
         table.table_deck.extend(restore_cards)
@@ -2071,9 +2221,13 @@ class Match(BaseModel):
             # after 0.0.2, deck is shuffled after restore cards
             self._random_shuffle(table.table_deck)
         logging.info(
-            f"Restore card action, player {player_idx}, "
-            f"number {len(card_idxs)}, cards: {card_names}, "
-            f"deck size {len(table.table_deck)}, hand size {len(table.hands)}"
+            "Restore card action, player %s, number %s, cards: %s, "
+            "deck size %d, hand size %d",
+            player_idx,
+            len(card_idxs),
+            card_names,
+            len(table.table_deck),
+            len(table.hands),
         )
         event_arg = RestoreCardEventArguments(action=action, card_names=card_names)
         return [event_arg]
@@ -2178,7 +2332,7 @@ class Match(BaseModel):
         """
         Create dice.
         """
-        dice: List[DieColor] = []
+        dice: List[DieColor]
         player_idx = action.player_idx
         table = self.player_tables[player_idx]
         number = action.number
@@ -2205,35 +2359,38 @@ class Match(BaseModel):
         # generate dice based on color
         if is_random:
             candidates.append(DieColor.OMNI)  # random, can be omni
-            for _ in range(number):
-                selected_color = candidates[int(self._random() * len(candidates))]
-                dice.append(selected_color)
+            candidate_number = len(candidates)
+            # draw all random numbers in one batch, same as calling
+            # `self._random` for each die.
+            dice = [
+                candidates[int(random_number * candidate_number)]
+                for random_number in self._random_batch(number)
+            ]
         elif is_different:
             if number > len(candidates):
                 self._set_match_state(MatchState.ERROR)  # pragma no cover
                 raise ValueError("Not enough dice colors.")
             self._random_shuffle(candidates)
-            candidates = candidates[:number]
-            for selected_color in candidates:
-                dice.append(selected_color)
+            dice = candidates[:number]
         else:
             if color is None:
                 self._set_match_state(MatchState.ERROR)  # pragma no cover
                 raise ValueError("Dice color should be specified.")
-            for _ in range(number):
-                dice.append(color)
+            dice = [color] * number
         # if there are more dice than the maximum, discard the rest
         max_obtainable_dice = self.config.max_dice_number - len(table.dice.colors)
         table.dice.colors += dice[:max_obtainable_dice]
         # sort dice by color
         table.sort_dice()
         logging.info(
-            f"Create dice action, player {player_idx}, "
-            f"number {len(dice)}, "
-            f"dice colors {dice}, "
-            f"obtain {len(dice[:max_obtainable_dice])}, "
-            f"over maximum {len(dice[max_obtainable_dice:])}, "
-            f"current dice on table {table.dice}"
+            "Create dice action, player %s, number %s, dice colors %s, "
+            "obtain %d, over maximum %d, current dice on table %s",
+            player_idx,
+            len(dice),
+            dice,
+            len(dice[:max_obtainable_dice]),
+            len(dice[max_obtainable_dice:]),
+            table.dice,
         )
         return [
             CreateDiceEventArguments(
@@ -2255,11 +2412,15 @@ class Match(BaseModel):
             removed_dice.append(table.dice.colors.pop(idx))
         # sort dice by color
         table.sort_dice()
+        # dice are popped from largest idx, reverse them to ascending idx order
+        removed_dice.reverse()
         logging.info(
-            f"Remove dice action, player {player_idx}, "
-            f"number {len(dice_idxs)}, "
-            f"dice colors {removed_dice.reverse()}, "
-            f"current dice on table {table.dice}"
+            "Remove dice action, player %s, number %s, dice colors %s, "
+            "current dice on table %s",
+            player_idx,
+            len(dice_idxs),
+            removed_dice,
+            table.dice,
         )
         return [RemoveDiceEventArguments(action=action, colors_removed=removed_dice)]
 
@@ -2383,7 +2544,10 @@ class Match(BaseModel):
             object, i.e. dendro reactions, a CreateObjectEventArguments
             will be generated.
         """
+        # damages from elemental reactions are appended during the loop. walk
+        # them with an index, so processed damages are kept in order.
         damage_lists = action.damage_value_list[:]
+        damage_idx = 0
         switch_character: List[int] = [-1, -1]
         create_objects: List[CreateObjectAction] = []
         assert self.event_handlers[0].name == "System"
@@ -2397,8 +2561,9 @@ class Match(BaseModel):
             | CreateObjectEventArguments
         ] = []
         infos: List[ReceiveDamageEventArguments] = []
-        while len(damage_lists) > 0:
-            damage = damage_lists.pop(0)
+        while damage_idx < len(damage_lists):
+            damage = damage_lists[damage_idx]
+            damage_idx += 1
             damage_original = damage.copy()
             assert (
                 damage.target_position.area == ObjectPositionType.CHARACTER
@@ -2445,11 +2610,7 @@ class Match(BaseModel):
             if new_object is not None:
                 create_objects.append(new_object)
             # apply 3-step damage modification
-            self._modify_value(damage, "REAL")
-            damage = DamageMultiplyValue.from_increase_value(damage)
-            self._modify_value(damage, "REAL")
-            damage = DamageDecreaseValue.from_multiply_value(damage)
-            self._modify_value(damage, "REAL")
+            damage = self._modify_damage_value(damage)
             # apply final damage and applied elements
             hp_before = character.hp
             character.hp -= damage.damage
@@ -2458,8 +2619,9 @@ class Match(BaseModel):
             if character.hp > character.max_hp:
                 character.hp = character.max_hp
             character.element_application = applied_elements
+            # all fields are created and validated above, skip validation
             infos.append(
-                ReceiveDamageEventArguments(
+                ReceiveDamageEventArguments.construct(
                     action=action,
                     original_damage=damage_original,
                     final_damage=damage,
@@ -3169,3 +3331,71 @@ class Match(BaseModel):
         self._set_match_state(MatchState.PLAYER_ACTION_REQUEST)
         logging.info(f"player {self.current_player} skipped player action.")
         return self._action_action_end(action.get_action_end_action())
+
+
+# State transitions of `Match.step` when all requests and events are cleared.
+# Key is current state, value is the next state (None to keep current state)
+# and the function to call after the state is set.
+_STATE_TRANSITIONS: Dict[
+    MatchState, Tuple[MatchState | None, Callable[[Match], None]]
+] = {
+    MatchState.STARTING: (
+        MatchState.STARTING_CARD_SWITCH,
+        Match._starting_card_switch,
+    ),
+    MatchState.STARTING_CARD_SWITCH: (
+        MatchState.STARTING_CHOOSE_CHARACTER,
+        Match._starting_choose_character,
+    ),
+    MatchState.STARTING_CHOOSE_CHARACTER: (MatchState.GAME_START, Match._game_start),
+    MatchState.GAME_START: (MatchState.ROUND_START, Match._round_start),
+    MatchState.ROUND_ROLL_DICE: (MatchState.ROUND_PREPARING, Match._round_prepare),
+    MatchState.ROUND_PREPARING: (
+        MatchState.PLAYER_ACTION_START,
+        Match._player_action_start,
+    ),
+    MatchState.PLAYER_ACTION_START: (
+        MatchState.PLAYER_ACTION_REQUEST,
+        Match._player_action_request,
+    ),
+    # request responded and all action clear
+    MatchState.PLAYER_ACTION_REQUEST: (None, Match._player_action_end),
+    MatchState.ROUND_ENDING: (MatchState.ROUND_ENDED, Match._round_ending),
+    MatchState.ROUND_ENDED: (MatchState.ROUND_START, Match._round_start),
+}
+
+
+# Action functions of `Match._act`, keyed by action class. Each returns a list
+# of its own event arguments type, and as `List` is invariant, values are typed
+# to return `List[Any]`.
+_ACTION_FUNCTIONS: Dict[type, Callable[[Match, Any], List[Any]]] = {
+    ChooseCharacterAction: Match._action_choose_character,
+    CreateDiceAction: Match._action_create_dice,
+    RemoveDiceAction: Match._action_remove_dice,
+    RestoreCardAction: Match._action_restore_card,
+    DrawCardAction: Match._action_draw_card,
+    RemoveCardAction: Match._action_remove_card,
+    SwitchCardAction: Match._action_switch_card,
+    SwitchCharacterAction: Match._action_switch_character,
+    DeclareRoundEndAction: Match._action_declare_round_end,
+    ActionEndAction: Match._action_action_end,
+    MakeDamageAction: Match._action_make_damage,
+    ChargeAction: Match._action_charge,
+    UseSkillAction: Match._action_use_skill,
+    UseCardAction: Match._action_use_card,
+    SkillEndAction: Match._action_skill_end,
+    CharacterDefeatedAction: Match._action_character_defeated,
+    CreateObjectAction: Match._action_create_object,
+    CreateRandomObjectAction: Match._action_create_random_object,
+    RemoveObjectAction: Match._action_remove_object,
+    ChangeObjectUsageAction: Match._action_change_object_usage,
+    MoveObjectAction: Match._action_move_object,
+    ConsumeArcaneLegendAction: Match._action_consume_arcane_legend,
+    GenerateChooseCharacterRequestAction: (
+        Match._action_generate_choose_character_request
+    ),
+    GenerateRerollDiceRequestAction: Match._action_generate_reroll_dice_request,
+    SkipPlayerActionAction: Match._action_skip_player_action,
+    CharacterReviveAction: Match._action_character_revive,
+    GenerateSwitchCardRequestAction: Match._action_generate_switch_card_request,
+}
@@ -14,12 +14,18 @@ from ..utils.class_registry import register_base_class
 
 from .event import GameStartEventArguments, UseCardEventArguments
 from ..utils import BaseModel, accept_same_or_higher_version
-from typing import List, Literal, Any, Tuple
+from typing import Dict, List, Literal, Any, Tuple
 from pydantic import validator
 from .action import Actions, ActionTypes, CreateObjectAction, RemoveCardAction
 from .consts import ObjectType, ObjectPositionType, CostLabels, PlayerActionLabels
 from .modifiable_values import CostValue, ModifiableValueTypes
-from .struct import DeckRestriction, MultipleObjectPosition, ObjectPosition, Cost
+from .struct import (
+    INVALID_POSITION,
+    DeckRestriction,
+    MultipleObjectPosition,
+    ObjectPosition,
+    Cost,
+)
 
 
 used_object_ids = set()
@@ -27,6 +33,42 @@ ID_MOD_NUM = 86400
 ID_MULTI_NUM = 1000000
 ID_RAND_NUM = 1024
 
+# event handler and value modifier names of each class, see `get_handler_tables`.
+_handler_tables: Dict[
+    type, Tuple[Dict[ActionTypes, str], Dict[ModifiableValueTypes, str]]
+] = {}
+
+
+def get_handler_tables(
+    cls: type,
+) -> Tuple[Dict[ActionTypes, str], Dict[ModifiableValueTypes, str]]:
+    """
+    Get event handler and value modifier names of a class, keyed by event type
+    and modifiable value type. They are collected from `dir(cls)` once and
+    cached, so dispatching events and modifying values only need a dict lookup
+    for each object, instead of building names and calling `getattr`.
+
+    Raises:
+        ValueError: If name of event handler or value modifier is invalid.
+    """
+    if cls in _handler_tables:
+        return _handler_tables[cls]
+    event_handlers: Dict[ActionTypes, str] = {}
+    value_modifiers: Dict[ModifiableValueTypes, str] = {}
+    for k in dir(cls):
+        if k[:14] == "event_handler_":
+            try:
+                event_handlers[ActionTypes(k[14:])] = k
+            except ValueError:
+                raise ValueError(f"Invalid event handler name: {k[14:]}")
+        if k[:15] == "value_modifier_":
+            try:
+                value_modifiers[ModifiableValueTypes(k[15:])] = k
+            except ValueError:
+                raise ValueError(f"Invalid value modifier name: {k[15:]}")
+    _handler_tables[cls] = (event_handlers, value_modifiers)
+    return _handler_tables[cls]
+
 
 class ObjectBase(BaseModel):
     """
@@ -55,22 +97,14 @@ class ObjectBase(BaseModel):
     # will not available.
     available_handler_in_deck: List[ActionTypes] = []
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # check event handler name valid once when the class is created,
+        # instead of on every instance
+        get_handler_tables(cls)
+
     def __init__(self, *argv, **kwargs):
         super().__init__(*argv, **kwargs)
-        # check event handler name valid
-        for k in dir(self):
-            if k[:14] == "event_handler_":
-                k = k[14:]
-                try:
-                    k = ActionTypes(k)
-                except ValueError:
-                    raise ValueError(f"Invalid event handler name: {k}")
-            if k[:15] == "value_modifier_":
-                k = k[15:]
-                try:
-                    k = ModifiableValueTypes(k)
-                except ValueError:
-                    raise ValueError(f"Invalid value modifier name: {k}")
         # if id is -1, generate a new id
         if self.id == -1:
             self.renew_id()
@@ -226,11 +260,7 @@ class CardBase(ObjectBase):
     ] = ObjectType.CARD
     strict_version_validation: bool = False  # default accept higher versions
     version: str
-    position: ObjectPosition = ObjectPosition(
-        player_idx=-1,
-        area=ObjectPositionType.INVALID,
-        id=-1,
-    )
+    position: ObjectPosition = INVALID_POSITION
     cost: Cost
     cost_label: int
     remove_when_used: bool = True
@@ -16,7 +16,7 @@ from ....event import (
     RoundPrepareEventArguments,
 )
 from ....match import Match
-from ....struct import Cost, ObjectPosition
+from ....struct import INVALID_POSITION, Cost, ObjectPosition
 from ....consts import (
     DAMAGE_TYPE_TO_ELEMENT,
     ELEMENT_TO_DIE_COLOR,
@@ -177,11 +177,7 @@ class SignoraSkillValidCheck(BaseModel):
     Used in all Signora's skills to check if skill is valid.
     """
 
-    position: ObjectPosition = ObjectPosition(
-        player_idx=-1,
-        area=ObjectPositionType.INVALID,
-        id=-1,
-    )
+    position: ObjectPosition = INVALID_POSITION
     damage_type: DamageElementalType
 
     def is_valid(self, match: Match) -> bool:
@@ -149,7 +149,8 @@ class PlayerTable(BaseModel):
         Sort the dice on the table.
         """
         order = self.dice_color_order()
-        self.dice.colors.sort(key=lambda x: order.index(x))
+        # dice are mostly sorted already, which timsort handles in linear time
+        self.dice.colors.sort(key=order.index)
 
     def get_object(self, position: ObjectPosition) -> ObjectBase | None:
         """
@@ -1,4 +1,5 @@
-from typing import List, Any, Literal
+from copy import deepcopy
+from typing import Dict, List, Any, Literal
 
 from .query import satisfy
 
@@ -6,6 +7,16 @@ from ..utils import BaseModel
 from .consts import ObjectPositionType, DieColor
 
 
+# areas checked in ObjectPosition._check_indices. Tuples of enum members are
+# built once, and `in` matches members by identity before comparing values.
+_UNCHECKED_AREAS = (ObjectPositionType.INVALID, ObjectPositionType.SYSTEM)
+_CHARACTER_AREAS = (
+    ObjectPositionType.CHARACTER_STATUS,
+    ObjectPositionType.SKILL,
+    ObjectPositionType.CHARACTER,
+)
+
+
 class ObjectPosition(BaseModel):
     """
     Position of an object in the game table, which will be set at initializing
@@ -39,17 +50,19 @@ class ObjectPosition(BaseModel):
 
     def __init__(self, *argv, **kwargs) -> None:
         super().__init__(*argv, **kwargs)
-        if self.area in [ObjectPositionType.INVALID, ObjectPositionType.SYSTEM]:
+        self._check_indices()
+
+    def _check_indices(self) -> None:
+        """
+        Check player_idx and character_idx are properly set based on area.
+        """
+        if self.area in _UNCHECKED_AREAS:
             # invalid or system position, do not check other attributes
             return
         # check player_idx is propoerly set
         assert self.player_idx >= 0, "player_idx should be non-negative."
         # check character_idx is properly set
-        if self.area in [
-            ObjectPositionType.CHARACTER_STATUS,
-            ObjectPositionType.SKILL,
-            ObjectPositionType.CHARACTER,
-        ]:
+        if self.area in _CHARACTER_AREAS:
             assert self.character_idx >= 0, "character_idx should be non-negative."
 
     def __setattr__(self, name: str, value: Any) -> None:
@@ -66,9 +79,10 @@ class ObjectPosition(BaseModel):
 
     def set_id(self, id: int) -> "ObjectPosition":
         """
-        Return a new ObjectPosition with the id set.
+        Return a new ObjectPosition with the id set. As other attributes are
+        already validated, it skips validation.
         """
-        return ObjectPosition(
+        return ObjectPosition.construct(
             player_idx=self.player_idx,
             character_idx=self.character_idx,
             area=self.area,
@@ -77,14 +91,17 @@ class ObjectPosition(BaseModel):
 
     def set_area(self, area: ObjectPositionType) -> "ObjectPosition":
         """
-        Return a new ObjectPosition with the area set.
+        Return a new ObjectPosition with the area set. As other attributes are
+        already validated, it skips validation and only checks indices.
         """
-        return ObjectPosition(
+        position = ObjectPosition.construct(
             player_idx=self.player_idx,
             character_idx=self.character_idx,
             area=area,
             id=self.id,
         )
+        position._check_indices()
+        return position
 
     def copy(self) -> "ObjectPosition":
         """
@@ -92,6 +109,12 @@ class ObjectPosition(BaseModel):
         """
         raise AssertionError("ObjectPosition is immutable.")
 
+    def __deepcopy__(self, memo: Any) -> "ObjectPosition":
+        """
+        As it is a immutable object, deep copies of matches can share it.
+        """
+        return self
+
     def check_position_valid(
         self,
         target_position: "ObjectPosition",
@@ -209,6 +232,15 @@ class ObjectPosition(BaseModel):
         return not self.satisfy(command, target, match)
 
 
+# shared position of objects that are not on the table yet. ObjectPosition is
+# immutable, so all such objects can refer to the same instance.
+INVALID_POSITION = ObjectPosition(
+    player_idx=-1,
+    area=ObjectPositionType.INVALID,
+    id=-1,
+)
+
+
 class MultipleObjectPosition(BaseModel):
     positions: List[ObjectPosition]
 
@@ -250,6 +282,20 @@ class Cost(BaseModel):
             original_value=ori_copy,
         )
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Cost":
+        """
+        Default costs of skills and cards are deep copied every time an object
+        is created. All fields except original_value are immutable, so share
+        them and skip validation, which is much faster than generic deepcopy.
+        """
+        result = Cost.construct(_fields_set=self.__fields_set__.copy(), **self.__dict__)
+        # record before copying original_value, so repeated references in one
+        # deepcopy are still shared, same as generic deepcopy.
+        memo[id(self)] = result
+        if self.original_value is not None:
+            result.__dict__["original_value"] = deepcopy(self.original_value, memo)
+        return result
+
     @property
     def total_dice_cost(self) -> int:
         """
@@ -2,6 +2,7 @@
 Tools that based on other modules.
 """
 import json
+from concurrent.futures import Executor
 from typing import List, Tuple
 
 from .server.event_handler import OmnipotentGuideEventHandler_3_3
@@ -88,3 +89,29 @@ def interact_match_with_agents(
         assert resp is not None
         match.respond(resp)
         match.step()
+
+
+def _step_match(match: Match) -> Match:
+    match.step()
+    return match
+
+
+def step_matches(matches: List[Match], executor: Executor | None = None) -> List[Match]:
+    """
+    Step multiple independent matches until they need response, e.g. matches
+    created by `Match.fork` for AI rollouts. Each match is still simulated
+    serially, matches are only run in parallel with each other.
+
+    Args:
+        matches (List[Match]): Matches to step.
+        executor (Executor | None, optional): If set, matches are stepped by
+            `executor.map`. With `ProcessPoolExecutor`, matches are pickled
+            into worker processes, and returned matches are new objects.
+            If None, matches are stepped one by one in current thread.
+
+    Returns:
+        List[Match]: Stepped matches in the same order as input.
+    """
+    if executor is None:
+        return [_step_match(match) for match in matches]
+    return list(executor.map(_step_match, matches))
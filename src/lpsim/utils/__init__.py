@@ -23,6 +23,10 @@ from .deck_code import (  # noqa: F401
 class BaseModel(pydantic.BaseModel):
     class Config:
         extra = pydantic.Extra.forbid  # default forbid extra fields
+        # models passed as field values are used as is. pydantic's shallow copy
+        # shares `__dict__` with the original model, so it gives no isolation
+        # but costs an allocation for every nested model.
+        copy_on_model_validation = "none"
 
 
 def list_unique_range_right(data: List[int], minn: int, maxn: int) -> bool:
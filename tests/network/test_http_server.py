@@ -0,0 +1,151 @@
+from fastapi.testclient import TestClient
+
+from lpsim.network.http_server import (
+    HTTPServer,
+    parse_state_fields,
+    project_state,
+    project_state_diff,
+)
+
+
+def get_state():
+    return {
+        "round_number": 3,
+        "match_state": "PLAYER_ACTION_REQUEST",
+        "player_tables": [
+            {
+                "player_idx": 0,
+                "dice": {"colors": ["OMNI", "PYRO"]},
+                "hands": [{"name": "Strategize"}],
+            },
+            {
+                "player_idx": 1,
+                "dice": {"colors": []},
+                "hands": [],
+            },
+        ],
+    }
+
+
+def test_parse_state_fields():
+    assert parse_state_fields("player_tables.dice, round_number,") == [
+        ("player_tables", "dice"),
+        ("round_number",),
+    ]
+    assert parse_state_fields("") == []
+
+
+def test_project_state():
+    state = get_state()
+    paths = parse_state_fields("player_tables.dice,round_number")
+    assert project_state(state, paths) == {
+        "round_number": 3,
+        "player_tables": [
+            {"dice": {"colors": ["OMNI", "PYRO"]}},
+            {"dice": {"colors": []}},
+        ],
+    }
+    # whole sub-tree is kept when path ends
+    assert project_state(state, parse_state_fields("player_tables")) == {
+        "player_tables": state["player_tables"]
+    }
+    # unknown fields are ignored
+    assert project_state(state, parse_state_fields("not_exist.field")) == {}
+    # state is not changed
+    assert state == get_state()
+
+
+def test_project_state_diff():
+    paths = parse_state_fields("player_tables.dice,round_number")
+    diff = [
+        ("change", "round_number", (3, 4)),
+        ("change", "match_state", ("PLAYER_ACTION_REQUEST", "ROUND_ENDING")),
+        ("change", ["player_tables", 0, "dice", "colors", 1], ("PYRO", "HYDRO")),
+        ("change", ["player_tables", 0, "player_idx"], (0, 1)),
+        ("add", ["player_tables", 0, "hands"], [(1, {"name": "Strategize"})]),
+        ("remove", ["player_tables", 1, "dice", "colors"], [(0, "OMNI")]),
+    ]
+    assert project_state_diff(diff, paths) == [diff[0], diff[2], diff[5]]
+
+
+def test_project_state_diff_parent_node():
+    paths = parse_state_fields("player_tables.dice,round_number")
+    table = {"player_idx": 1, "dice": {"colors": ["OMNI"]}, "hands": []}
+    diff = [
+        # add a new table to the list
+        ("add", "player_tables", [(2, table)]),
+        # add fields to a table, only dice is requested
+        ("add", ["player_tables", 0], [("dice", {"colors": []}), ("hands", [])]),
+        # no requested field is added
+        ("remove", ["player_tables", 1], [("hands", [])]),
+        # add at root
+        ("add", "", [("round_number", 1), ("match_state", "WAITING")]),
+        # change a parent node
+        ("change", ["player_tables", 1], (table, {**table, "hands": [1]})),
+    ]
+    assert project_state_diff(diff, paths) == [
+        ("add", "player_tables", [(2, {"dice": {"colors": ["OMNI"]}})]),
+        ("add", ["player_tables", 0], [("dice", {"colors": []})]),
+        ("add", "", [("round_number", 1)]),
+        (
+            "change",
+            ["player_tables", 1],
+            ({"dice": {"colors": ["OMNI"]}}, {"dice": {"colors": ["OMNI"]}}),
+        ),
+    ]
+    # diff is not changed
+    assert diff[1] == (
+        "add",
+        ["player_tables", 0],
+        [("dice", {"colors": []}), ("hands", [])],
+    )
+    # no paths related
+    assert project_state_diff(diff, parse_state_fields("winner")) == []
+
+
+def test_websocket_game_state():
+    deck = """
+        default_version:4.0
+        character:GeoMob*3
+        Strategize*30
+    """
+    server = HTTPServer(decks=[deck, deck])
+    # enter the client, so all requests and websockets share one event loop
+    with TestClient(server.app) as client:
+        with client.websocket_connect("/ws/-1") as websocket:
+            # initial full state and all diffs after it
+            states = websocket.receive_json()
+            assert states[0]["idx"] == 0
+            assert states[0]["type"] == "FULL"
+            assert states == client.get("/state/after/0/-1").json()
+            uuid = states[0]["uuid"]
+
+            # responds push the same states as the respond results. New states
+            # are generated after both players switched cards.
+            result = []
+            for player_idx in range(2):
+                result += client.post(
+                    "/respond",
+                    json={"player_idx": player_idx, "command": "sw_card", "uuid": uuid},
+                ).json()
+            assert len(result) > 0
+            assert result[0]["idx"] == states[-1]["idx"] + 1
+            pushed = []
+            while len(pushed) == 0 or pushed[-1]["idx"] != result[-1]["idx"]:
+                pushed += websocket.receive_json()
+            assert pushed == result
+
+            # after reset, states of new match are sent from full state
+            reset_result = client.post("/reset", json={}).json()
+            states = websocket.receive_json()
+            assert states[0]["idx"] == 0
+            assert states[0]["type"] == "FULL"
+            assert states[0]["uuid"] == reset_result["uuid"] != uuid
+
+
+if __name__ == "__main__":
+    test_parse_state_fields()
+    test_project_state()
+    test_project_state_diff()
+    test_project_state_diff_parent_node()
+    test_websocket_game_state()
@@ -464,12 +464,8 @@ def test_vanarana():
             while True:
                 test_id = get_test_id_from_command(agent_0)
                 if test_id == 1:
-                    current_colors = [
-                        match.player_tables[0].dice.colors.copy(),
-                        match.player_tables[1].dice.colors.copy(),
-                    ]
-                    assert len(current_colors[0]) == 8
-                    assert len(current_colors[1]) == 8
+                    assert len(match.player_tables[0].dice.colors) == 8
+                    assert len(match.player_tables[1].dice.colors) == 8
                     assert len(match.player_tables[0].supports) == 4
                     assert len(match.player_tables[1].supports) == 4
                     colors = [
@@ -498,26 +494,24 @@ def test_vanarana():
                 elif test_id == 3:
                     supports = match.player_tables[0].supports
                     assert len(supports) == 4
-                    assert supports[3].usage == 1
-                    for i in range(3):
-                        assert supports[i].usage == 2
+                    usages = [2, 2, 2, 1]
                     colors = [
                         ["GEO", "GEO"],
                         ["DENDRO", "DENDRO"],
                         ["ELECTRO", "GEO"],
                         ["ANEMO"],
                     ]
-                    for support, c in zip(supports, colors):
+                    for support, u, c in zip(supports, usages, colors):
                         assert isinstance(support, Vanarana_3_7)
+                        assert support.usage == u
                         assert support.colors == c
                     supports = match.player_tables[1].supports
                     assert len(supports) == 4
-                    assert supports[0].usage == 1
-                    for i in range(3):
-                        assert supports[i + 1].usage == 0
+                    usages = [1, 0, 0, 0]
                     colors = [["OMNI"], [], [], []]
-                    for support, c in zip(supports, colors):
+                    for support, u, c in zip(supports, usages, colors):
                         assert isinstance(support, Vanarana_3_7)
+                        assert support.usage == u
                         assert support.colors == c
                 elif test_id == 4:
                     supports = (
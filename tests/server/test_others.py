@@ -1,3 +1,4 @@
+from copy import deepcopy
 from typing import Dict, Literal
 import pytest
 from lpsim.utils.desc_registry import DescDictType
@@ -10,13 +11,20 @@ from lpsim.utils.class_registry import get_instance, register_class
 
 from lpsim.agents.random_agent import RandomAgent
 from lpsim.agents.nothing_agent import NothingAgent
-from lpsim.server.action import CreateDiceAction, DrawCardAction, MoveObjectAction
+from lpsim.server.action import (
+    ActionTypes,
+    CreateDiceAction,
+    CreateRandomObjectAction,
+    DrawCardAction,
+    MoveObjectAction,
+)
 from lpsim.server.consts import DamageElementalType, ObjectPositionType
 from lpsim.server.deck import Deck
 from lpsim.server.interaction import SwitchCardResponse
 from lpsim.server.object_base import ObjectBase
-from lpsim.server.struct import ObjectPosition
+from lpsim.server.struct import Cost, ObjectPosition
 from lpsim.server.match import Match, MatchConfig
+from lpsim.server.event_controller import EventFrame
 
 
 def test_object_position_validation():
@@ -69,33 +77,31 @@ def test_object_position_validation():
 
 
 def test_objectbase_wrong_handler_name():
-    class WrongEventHandler(ObjectBase):
-        name: Literal["WrongEventHandler"] = "WrongEventHandler"
-        position: ObjectPosition = ObjectPosition(
-            player_idx=-1,
-            area=ObjectPositionType.INVALID,
-            id=-1,
-        )
-
-        def event_handler_NOT_EXIST(self, event):
-            ...  # pragma: no cover
-
     with pytest.raises(ValueError):
-        _ = WrongEventHandler()
 
-    class WrongValueModifier(ObjectBase):
-        name: Literal["WrongValueModifier"] = "WrongValueModifier"
-        position: ObjectPosition = ObjectPosition(
-            player_idx=-1,
-            area=ObjectPositionType.INVALID,
-            id=-1,
-        )
+        class WrongEventHandler(ObjectBase):
+            name: Literal["WrongEventHandler"] = "WrongEventHandler"
+            position: ObjectPosition = ObjectPosition(
+                player_idx=-1,
+                area=ObjectPositionType.INVALID,
+                id=-1,
+            )
 
-        def value_modifier_NOT_EXIST(self, value, match, mode):
-            ...  # pragma: no cover
+            def event_handler_NOT_EXIST(self, event):
+                ...  # pragma: no cover
 
     with pytest.raises(ValueError):
-        _ = WrongValueModifier()
+
+        class WrongValueModifier(ObjectBase):
+            name: Literal["WrongValueModifier"] = "WrongValueModifier"
+            position: ObjectPosition = ObjectPosition(
+                player_idx=-1,
+                area=ObjectPositionType.INVALID,
+                id=-1,
+            )
+
+            def value_modifier_NOT_EXIST(self, value, match, mode):
+                ...  # pragma: no cover
 
 
 def test_match_config_and_match_errors():
@@ -567,6 +573,51 @@ def test_blacklist_draw_card_005():
         )
 
 
+def test_load_legacy_create_random_object_action():
+    action = CreateRandomObjectAction(
+        object_position=ObjectPosition(
+            player_idx=0, area=ObjectPositionType.SUMMON, id=-1
+        ),
+        object_names=["Oceanic Mimic: Squirrel", "Oceanic Mimic: Frog"],
+        object_arguments={},
+        number=1,
+        replace=False,
+    )
+    # older versions saved CreateRandomObjectAction with type CREATE_OBJECT
+    legacy = action.dict()
+    legacy["type"] = ActionTypes.CREATE_OBJECT.value
+
+    match = Match(version="0.0.4")
+    match_dict = match.dict()
+    match_dict["last_action"] = legacy
+    loaded = Match(**match_dict)
+    assert isinstance(loaded.last_action, CreateRandomObjectAction)
+    assert loaded.last_action == action
+    # saved again in the new format, and loads to the same action
+    assert Match(**loaded.dict()).last_action == action
+
+    frame = EventFrame(events=[], triggered_actions=[legacy, action.dict()])
+    assert frame.triggered_actions == [action, action]
+    assert EventFrame(**frame.dict()).triggered_actions == [action, action]
+
+
+def test_cost_deepcopy_original_value():
+    cost = Cost(any_dice_number=2, original_value=Cost(any_dice_number=3))
+    copied = deepcopy(cost)
+    assert copied == cost
+    assert copied is not cost
+    assert copied.original_value == cost.original_value
+    assert copied.original_value is not cost.original_value
+    copied.any_dice_number = 1
+    copied.original_value.any_dice_number = 1
+    assert cost.any_dice_number == 2
+    assert cost.original_value.any_dice_number == 3
+    # repeated references in one deepcopy are still shared
+    copied_list = deepcopy([cost, cost])
+    assert copied_list[0] is copied_list[1]
+    assert copied_list[0].original_value is copied_list[1].original_value
+
+
 if __name__ == "__main__":
     # test_object_position_validation()
     # test_match_config_and_match_errors()
@@ -1,5 +1,6 @@
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Literal
 import dictdiffer
 import pytest
@@ -17,6 +18,7 @@ from lpsim.server.deck import Deck
 from lpsim.agents.random_agent import RandomAgent
 from lpsim.agents.interaction_agent import InteractionAgent
 from lpsim.server.character.electro.fischl_3_3 import Oz_3_3
+from lpsim.tools import step_matches
 from tests.utils_for_test import (
     get_test_id_from_command,
     set_16_omni,
@@ -1401,6 +1403,74 @@ def test_different_random_state():
     assert match.random_state[0] == 3
     assert match.random_state[2] is None
 
+    # numpy PCG64 random state
+    match = Match(random_state=["PCG64"])
+    match.set_deck([deck, deck])
+    match.config.max_same_card_number = 30
+    match.config.card_number = None
+    match.config.character_number = None
+    match.config.check_deck_restriction = False
+    assert match.start()[0]
+    match.step()
+    match_copy = match.copy(deep=True)
+    assert match.random_state[0] == "PCG64"
+    assert len(match.random_state) == 5
+    assert match_copy._random_batch(10) == match._random_batch(10)
+    match_load = Match(**json.loads(match.json()))
+    assert match_load._random() == match._random()
+
+
+def test_fork():
+    deck = Deck.from_str(
+        """
+        default_version:4.0
+        character:Fischl
+        character:Mona
+        character:Nahida
+        Timmie*30
+        """
+    )
+    for random_state in [[], get_random_state(), ["PCG64"]]:
+        match = Match(random_state=random_state)
+        match.set_deck([deck, deck])
+        match.config.max_same_card_number = 30
+        match.config.check_deck_restriction = False
+        assert match.start()[0]
+        match.step()
+        forks = match.fork(3)
+        assert len(forks) == 3
+        for fork in forks:
+            assert fork.state == match.state
+            assert fork.player_tables[0].dice is not match.player_tables[0].dice
+        numbers = [fork._random_batch(5) for fork in forks]
+        assert numbers[0] != numbers[1] and numbers[1] != numbers[2]
+
+
+def test_step_matches():
+    deck = Deck.from_str(
+        """
+        default_version:4.0
+        character:Fischl
+        character:Mona
+        character:Nahida
+        Timmie*30
+        """
+    )
+    match = Match(random_state=["PCG64"])
+    match.set_deck([deck, deck])
+    match.config.max_same_card_number = 30
+    match.config.check_deck_restriction = False
+    assert match.start()[0]
+    forks = match.fork(2)
+    with ThreadPoolExecutor(2) as executor:
+        results = step_matches(forks, executor)
+    assert all(x is y for x, y in zip(results, forks))
+    for fork in results:
+        assert len(fork.requests) == 2
+    assert len(match.requests) == 0
+    assert step_matches([match])[0] is match
+    assert len(match.requests) == 2
+
 
 if __name__ == "__main__":
     # test_match_pipeline()
@@ -1425,3 +1495,5 @@ if __name__ == "__main__":
     # test_round_end_all_lose()
     test_use_card_event_serialize()
     test_different_random_state()
+    test_fork()
+    test_step_matches()